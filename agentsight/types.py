@@ -1,7 +1,7 @@
 from typing import Dict, Union, BinaryIO
 from io import BytesIO
 
-FileData = Union[bytes, BinaryIO, BytesIO]
+FileData = Union[bytes, bytearray, memoryview, BinaryIO, BytesIO]
 
 # Updated attachment input type
 AttachmentInput = Union[
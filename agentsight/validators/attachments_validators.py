@@ -1,19 +1,130 @@
-import base64
-import binascii
-from typing import List, Dict, Any
+import string
+from typing import Iterable, List, Dict, Any
 from agentsight.exceptions import InvalidAttachmentException
 from agentsight.enums import AttachmentMode
 from agentsight.types import AttachmentInput
+
+# Characters allowed in a base64 body; '=' is only valid as trailing padding
+_B64_ALPHABET = (string.ascii_letters + string.digits + "+/").encode("ascii")
+
+# Padding required for each incomplete final quantum length
+_B64_PADDING = {2: 2, 3: 1}
+
+# Binary types accepted as form data payloads
+_BINARY_TYPES = (bytes, bytearray, memoryview)
+
+# Mutable or borrowed buffers, stored as bytes so tracked items can be deep-copied and sent
+_BUFFER_TYPES = (bytearray, memoryview)
+
+
+def _is_valid_base64(data: str) -> bool:
+    """
+    Check base64 input without decoding it.
+
+    Accepts exactly what ``base64.b64decode(data, validate=True)`` accepts,
+    but scans the alphabet with ``bytes.translate`` instead of allocating
+    the decoded output.
+    """
+    # Cheap C-level rejection of non-ASCII input before any scanning
+    if not data.isascii():
+        return False
+
+    raw = data.encode("ascii")
+    body = raw.rstrip(b"=")
+    if body.translate(None, _B64_ALPHABET):
+        return False
+
+    padding = len(raw) - len(body)
+    remainder = len(body) % 4
+    if remainder == 0:
+        return bool(body) or not padding
+    return padding == _B64_PADDING.get(remainder)
+
+
+def _process_base64_attachment(i: int, attachment: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one base64-mode attachment and return its processed form."""
+    required_keys = ['filename', 'mime_type', 'data']
+    missing_keys = [key for key in required_keys if key not in attachment]
+    if missing_keys:
+        raise InvalidAttachmentException(
+            f"Attachment {i+1} missing required keys: {', '.join(missing_keys)}"
+        )
+    
+    filename = attachment.get('filename')
+    mime_type = attachment.get('mime_type')
+    data = attachment.get('data')
+    
+    # Validate filename and mime_type
+    if not filename or not isinstance(filename, str) or not filename.strip():
+        raise InvalidAttachmentException(f"Attachment {i+1} has invalid or empty filename")
+    
+    if not mime_type or not isinstance(mime_type, str) or not mime_type.strip():
+        raise InvalidAttachmentException(f"Attachment {i+1} has invalid or empty mime_type")
+    
+    # Validate base64 string
+    if not isinstance(data, str):
+        raise InvalidAttachmentException(f"Attachment {i+1}: In base64 mode, 'data' must be a base64 string")
+    
+    if not _is_valid_base64(data):
+        raise InvalidAttachmentException(f"Attachment {i+1} '{filename}' has invalid base64 data")
+    
+    return {
+        'filename': filename,
+        'mime_type': mime_type,
+        'data': data
+    }
+
+
+def _process_form_data_attachment(i: int, attachment: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one form-data-mode attachment and return its processed form."""
+    if 'data' not in attachment:
+        raise InvalidAttachmentException(f"Attachment {i+1} missing required key: 'data'")
+    
+    data = attachment.get('data')
+    
+    # Validate that data is bytes or file-like object (not string)
+    if isinstance(data, str):
+        raise InvalidAttachmentException(
+            f"Attachment {i+1}: In form_data mode, 'data' must be bytes or file-like object, not string"
+        )
+    
+    if not isinstance(data, _BINARY_TYPES) and not hasattr(data, 'read'):
+        raise InvalidAttachmentException(
+            f"Attachment {i+1}: In form_data mode, 'data' must be bytes or file-like object"
+        )
     
+    # Shallow copy keeps every provided field and shares the payload by reference;
+    # a missing filename or mime_type is filled in later
+    processed_attachment = attachment.copy()
+    
+    # memoryview can't be deep-copied and the send helpers only handle bytes
+    if isinstance(data, _BUFFER_TYPES):
+        processed_attachment['data'] = bytes(data)
+    
+    # 'content_type' is accepted as an alias for 'mime_type'
+    content_type = processed_attachment.pop('content_type', None)
+    if 'mime_type' in processed_attachment or 'content_type' in attachment:
+        processed_attachment['mime_type'] = processed_attachment.get('mime_type') or content_type
+    
+    return processed_attachment
+
+
+# Per-mode attachment processors, looked up once per call
+_PROCESSORS = {
+    AttachmentMode.BASE64: _process_base64_attachment,
+    AttachmentMode.FORM_DATA: _process_form_data_attachment,
+}
+
+
 def validate_and_process_attachments_flexible(
-    attachments: List[AttachmentInput], 
+    attachments: Iterable[AttachmentInput], 
     mode: AttachmentMode
 ) -> List[Dict[str, Any]]:
     """
     Validate and process attachments based on mode.
     
     Args:
-        attachments: List of attachment objects
+        attachments: List (or other iterable, e.g. tuple or generator) of attachment objects
         mode: AttachmentMode enum
         
     Returns:
@@ -22,12 +133,16 @@ def validate_and_process_attachments_flexible(
     Raises:
         InvalidAttachmentException: If attachments are invalid
     """
-    if not attachments:
-        raise InvalidAttachmentException("Attachments list cannot be empty")
-    
-    if not isinstance(attachments, list):
+    # Any iterable is walked once as-is; strings, bytes and dicts are iterable but never a list of attachments
+    if isinstance(attachments, (str, bytes, dict)) or not hasattr(attachments, '__iter__'):
+        if not attachments:
+            raise InvalidAttachmentException("Attachments list cannot be empty")
         raise InvalidAttachmentException("Attachments must be provided as a list")
     
+    processor = _PROCESSORS.get(mode) if isinstance(mode, AttachmentMode) else None
+    if processor is None:
+        raise InvalidAttachmentException(f"Invalid mode: {mode}")
+    
     processed_attachments = []
     
     for i, attachment in enumerate(attachments):
@@ -36,73 +151,10 @@ def validate_and_process_attachments_flexible(
                 f"Attachment {i+1}: Must be a dictionary with required keys"
             )
         
-        if mode == AttachmentMode.BASE64:
-            # Original behavior for base64 mode
-            required_keys = ['filename', 'mime_type', 'data']
-            missing_keys = [key for key in required_keys if key not in attachment]
-            if missing_keys:
-                raise InvalidAttachmentException(
-                    f"Attachment {i+1} missing required keys: {', '.join(missing_keys)}"
-                )
-            
-            filename = attachment.get('filename')
-            mime_type = attachment.get('mime_type')
-            data = attachment.get('data')
-            
-            # Validate filename and mime_type
-            if not filename or not isinstance(filename, str) or not filename.strip():
-                raise InvalidAttachmentException(f"Attachment {i+1} has invalid or empty filename")
-            
-            if not mime_type or not isinstance(mime_type, str) or not mime_type.strip():
-                raise InvalidAttachmentException(f"Attachment {i+1} has invalid or empty mime_type")
-            
-            # Validate base64 string
-            if not isinstance(data, str):
-                raise InvalidAttachmentException(f"Attachment {i+1}: In base64 mode, 'data' must be a base64 string")
-            
-            try:
-                base64.b64decode(data, validate=True)
-            except (binascii.Error, ValueError):
-                raise InvalidAttachmentException(f"Attachment {i+1} '{filename}' has invalid base64 data")
-            
-            processed_attachments.append({
-                'filename': filename,
-                'mime_type': mime_type,
-                'data': data
-            })
-        
-        elif mode == AttachmentMode.FORM_DATA:
-            # New simplified behavior for form data mode
-            if 'data' not in attachment:
-                raise InvalidAttachmentException(f"Attachment {i+1} missing required key: 'data'")
-            
-            data = attachment.get('data')
-            
-            # Validate that data is bytes or file-like object (not string)
-            if isinstance(data, str):
-                raise InvalidAttachmentException(
-                    f"Attachment {i+1}: In form_data mode, 'data' must be bytes or file-like object, not string"
-                )
-            
-            # Build processed attachment
-            processed_attachment = {'data': data}
-            
-            # Add filename if provided, otherwise it will be auto-generated later
-            if 'filename' in attachment:
-                processed_attachment['filename'] = attachment['filename']
-            
-            # Add mime_type if provided, otherwise it will be auto-detected later
-            if 'mime_type' in attachment or 'content_type' in attachment:
-                processed_attachment['mime_type'] = attachment.get('mime_type') or attachment.get('content_type')
-            
-            # Include any other fields that were provided
-            for key, value in attachment.items():
-                if key not in ['data', 'filename', 'mime_type', 'content_type']:
-                    processed_attachment[key] = value
-            
-            processed_attachments.append(processed_attachment)
-        
-        else:
-            raise InvalidAttachmentException(f"Invalid mode: {mode}")
+        processed_attachments.append(processor(i, attachment))
+    
+    # Checked after the loop so iterators without a length are handled too
+    if not processed_attachments:
+        raise InvalidAttachmentException("Attachments list cannot be empty")
         
     return processed_attachments
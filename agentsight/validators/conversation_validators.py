@@ -4,9 +4,14 @@ from agentsight.exceptions import (
     InvalidConversationDataException
 )
 
+def _truthy(value: Any) -> bool:
+    """Return True for a truthy value, treating whitespace-only strings as empty."""
+    # isspace() scans in place, unlike strip() which builds a new string
+    return bool(value) and (not isinstance(value, str) or not value.isspace())
+
 def validate_conversation_id(data: Dict[str, Any]) -> None:
     """Validate conversation_id is present and raise specific exception if not."""
-    if not bool(str(data.get("conversation_id", "") or "").strip()):
+    if not _truthy(data.get("conversation_id")):
         raise MissingConversationIdException()
 
 def validate_conversation_data(data: Dict[str, Any]) -> bool:
@@ -15,24 +20,18 @@ def validate_conversation_data(data: Dict[str, Any]) -> bool:
     validate_conversation_id(data)
     
     # Then check that at least question or answer is present
-    has_content = bool(
-        (str(data.get("question", "") or "").strip() and
-        str(data.get("answer", "") or "").strip()) or
-        str(data.get("content", "") or "").strip()
+    return (
+        (_truthy(data.get("question")) and _truthy(data.get("answer"))) or
+        _truthy(data.get("content"))
     )
-    
-    return has_content
 
 def validate_question_and_answer_data(data: Dict[str, Any]) -> bool:
     """Validate question and answer data structure."""
-    return bool(
-        str(data.get("question", "") or "").strip() and
-        str(data.get("answer", "") or "").strip()
-    )
+    return _truthy(data.get("question")) and _truthy(data.get("answer"))
 
 def validate_content_data(data: Dict[str, Any]) -> bool:
     """Validate if content is in data."""
-    return bool(str(data.get("content", "") or "").strip())
+    return _truthy(data.get("content"))
     
 def validate_action_data(data: Dict[str, Any]) -> bool:
     """Validate action data structure."""
@@ -40,7 +39,7 @@ def validate_action_data(data: Dict[str, Any]) -> bool:
     validate_conversation_id(data)
     
     # Check that action_name is present
-    return bool(str(data.get("action_name", "") or "").strip())
+    return _truthy(data.get("action_name"))
 
 def validate_button_data(data: Dict[str, Any]) -> bool:
     """Validate button data structure."""
@@ -48,10 +47,10 @@ def validate_button_data(data: Dict[str, Any]) -> bool:
     validate_conversation_id(data)
     
     # Check that all required button fields are present
-    return bool(
-        str(data.get("button_event", "") or "").strip() and
-        str(data.get("label", "") or "").strip() and
-        str(data.get("value", "") or "").strip()
+    return (
+        _truthy(data.get("button_event")) and
+        _truthy(data.get("label")) and
+        _truthy(data.get("value"))
     )
 
 def validate_feedback_data(data: Dict[str, Any]) -> bool:
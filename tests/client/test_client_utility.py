@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from threading import Thread
 from agentsight.client import ConversationTracker
 import pytest
@@ -130,6 +130,35 @@ class TestConversationTrackerSendTrackedData:
         assert result["summary"]["answers"] == 1
         assert result["summary"]["actions"] == 1  # Token usage action
     
+    @pytest.mark.parametrize("make_data", [bytearray, memoryview], ids=["bytearray", "memoryview"])
+    def test_send_tracked_data_with_buffer_attachments(self, valid_api_key, make_data):
+        """Test buffer form_data attachments survive tracking and are sent as bytes."""
+        tracker = ConversationTracker(api_key=valid_api_key)
+        tracker._http_client = Mock()
+        
+        # Mock HTTP responses
+        tracker._http_client.send_payload.side_effect = [
+            {"id": "conv_123"},  # conversation
+            {"id": "q1"}         # question
+        ]
+        tracker._http_client.send_form_data_payload_with_message.return_value = {"id": "att1"}
+        
+        # Track a question with a buffer attachment
+        tracker.get_or_create_conversation("conv_123")
+        tracker.track_human_message(
+            "Test question",
+            attachments=[{"data": make_data(b"file content"), "filename": "test.txt"}],
+            attachment_mode="form_data"
+        )
+        
+        # Send tracked data
+        result = tracker.send_tracked_data()
+        
+        assert result["summary"]["errors"] == 0
+        call_kwargs = tracker._http_client.send_form_data_payload_with_message.call_args.kwargs
+        assert call_kwargs["attachments"][0]["data"] == b"file content"
+        assert type(call_kwargs["attachments"][0]["data"]) is bytes
+    
     def test_send_tracked_data_thread_safety(self, valid_api_key):
         """Test that send_tracked_data is thread-safe."""
         tracker = ConversationTracker(api_key=valid_api_key)
@@ -232,9 +261,7 @@ class TestConversationTrackerUtilityMethods:
         
         tracker._ensure_conversation_storage("conv_123")
         
-        assert "conv_123" in tracker._tracked_data
-        assert "items" in tracker._tracked_data["conv_123"]
-        assert isinstance(tracker._tracked_data["conv_123"]["items"], list)
+        assert tracker._tracked_data == {"conv_123": {"items": []}}
     
     def test_ensure_conversation_storage_idempotent(self, valid_api_key):
         """Test that _ensure_conversation_storage is idempotent."""
@@ -245,8 +272,7 @@ class TestConversationTrackerUtilityMethods:
         tracker._ensure_conversation_storage("conv_123")
         
         # Should only have one entry
-        assert len(tracker._tracked_data) == 1
-        assert "conv_123" in tracker._tracked_data
+        assert tracker._tracked_data == {"conv_123": {"items": []}}
     
     def test_add_tracking_item_creates_proper_structure(self, valid_api_key):
         """Test that _add_tracking_item creates proper structure."""
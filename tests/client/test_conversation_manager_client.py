@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from agentsight.client.conversation_manager_client import ConversationManager, conversation_manager
 from agentsight.exceptions import (
     NoApiKeyException,
@@ -95,7 +95,6 @@ class TestConversationManagerInitialization:
         
         # Should be the same instance
         assert manager1 is manager2
-        assert id(manager1) == id(manager2)
     
     def test_singleton_reinitialization_prevented(self, valid_api_key):
         """Test that singleton prevents re-initialization."""
@@ -531,8 +530,6 @@ class TestConversationManagerRenameConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         manager._http_client.patch.side_effect = ConversationApiException(
             "API error",
             status_code=500
@@ -546,8 +543,6 @@ class TestConversationManagerRenameConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         # Mock lookup failure
         manager._http_client.get.side_effect = ConversationApiException(
             "Conversation not found",
@@ -700,8 +695,6 @@ class TestConversationManagerMarkConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         manager._http_client.post.side_effect = ConversationApiException(
             "API error",
             status_code=500
@@ -715,8 +708,6 @@ class TestConversationManagerMarkConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         # Mock lookup failure
         manager._http_client.get.side_effect = ConversationApiException(
             "Conversation not found",
@@ -855,8 +846,6 @@ class TestConversationManagerDeleteConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import NotFoundException
-        
         manager._http_client.get.side_effect = NotFoundException("Conversation not found")
         
         with pytest.raises(NotFoundException):
@@ -870,8 +859,6 @@ class TestConversationManagerDeleteConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import NotFoundException
-        
         manager._http_client.delete.side_effect = NotFoundException("Conversation not found or already deleted")
         
         with pytest.raises(NotFoundException):
@@ -882,8 +869,6 @@ class TestConversationManagerDeleteConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         manager._http_client.delete.side_effect = ConversationApiException(
             "API error",
             status_code=500
@@ -897,8 +882,6 @@ class TestConversationManagerDeleteConversation:
         manager = ConversationManager(api_key=valid_api_key)
         manager._http_client = Mock()
         
-        from agentsight.exceptions import ConversationApiException
-        
         # Mock lookup failure
         manager._http_client.get.side_effect = ConversationApiException(
             "Conversation not found",
@@ -963,7 +946,6 @@ class TestConversationManagerAutoInitialized:
         
         # Should be the same instance
         assert manager1 is manager2
-        assert id(manager1) == id(manager2)
         
         # Should use the first API key from first initialization
         assert manager1.config.api_key == valid_api_key
@@ -978,7 +960,6 @@ class TestConversationManagerAutoInitialized:
         
         # Should be the same instance
         assert manager1 is manager2
-        assert id(manager1) == id(manager2)
         
         # Should use the first API key
         assert manager1.config.api_key == valid_api_key
@@ -1,19 +1,49 @@
+import re
 import pytest
-from unittest.mock import patch, MagicMock
+from threading import Lock
+from unittest.mock import patch
 from agentsight.exceptions import NoApiKeyException, InvalidApiKeyException
 from agentsight.client import ConversationTracker
 from agentsight.config import Config
 from agentsight.enums import LogLevel, TokenHandlerType
 
+_LOCK_TYPE = type(Lock())
+
+EXISTING_CONFIG_KEY = "ags_11111111111111111111111111111111_111111"
+
+MISSING_KEY_MESSAGE = "API Key is missing"
+
+BAD_KEYS_NO_API = ("", None, "   ")
+BAD_KEYS_INVALID = (
+    "invalid-key-format",
+    " ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3 ",  # surrounding spaces
+    "wrong_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3",  # wrong prefix
+    "ags_1a2b3c4d5e6f7890abcdef123456789_a1b2c3",  # 31 chars instead of 32
+    "ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c34",  # checksum too long
+)
+
 class TestConversationTrackerInitialization:
     """Test cases for ConversationTracker initialization."""
     
-    def test_init_with_api_key(self, valid_api_key):
-        """Test initialization with API key."""
+    @pytest.mark.singleton
+    def test_fresh_tracker_default_state(self, reset_singleton, valid_api_key):
+        """Test the state of a freshly constructed tracker."""
         tracker = ConversationTracker(api_key=valid_api_key)
+        
+        # Config defaults
         assert tracker.config.api_key == valid_api_key
+        assert tracker.config.conversation_id is None
+        assert tracker.config.endpoint is not None  # Should have default endpoint
+        assert tracker.config.log_level is not None  # Should have default log level
+        
+        # Internal state
         assert tracker._tracked_data == {}
-        assert tracker._lock is not None
+        assert isinstance(tracker._lock, _LOCK_TYPE)
+        assert tracker._token_handler is None
+        
+        # HTTP client shares the tracker config
+        assert tracker._http_client is not None
+        assert tracker._http_client.config is tracker.config
     
     def test_init_with_config_object(self, test_config):
         """Test initialization with Config object."""
@@ -37,29 +67,14 @@ class TestConversationTrackerInitialization:
     
     def test_init_without_api_key_raises_exception(self):
         """Test that initialization without API key raises NoApiKeyException."""
-        with pytest.raises(NoApiKeyException):
+        with pytest.raises(NoApiKeyException, match=MISSING_KEY_MESSAGE):
             ConversationTracker()
     
-    def test_init_with_empty_api_key_raises_exception(self):
-        """Test that initialization with empty API key raises NoApiKeyException."""
-        with pytest.raises(NoApiKeyException):
-            ConversationTracker(api_key="")
-    
-    def test_init_with_none_api_key_raises_exception(self):
-        """Test that initialization with None API key raises NoApiKeyException."""
-        with pytest.raises(NoApiKeyException):
-            ConversationTracker(api_key=None)
-    
-    def test_http_client_initialization(self, valid_api_key):
-        """Test that HTTPClient is initialized correctly."""
-        tracker = ConversationTracker(api_key=valid_api_key)
-        
-        # Test that _http_client attribute exists and is properly initialized
-        assert hasattr(tracker, '_http_client')
-        assert tracker._http_client is not None
-        
-        # Test that the http client has the expected config
-        assert tracker._http_client.config == tracker.config
+    @pytest.mark.parametrize("api_key", BAD_KEYS_NO_API)
+    def test_init_with_missing_api_key_raises_exception(self, api_key):
+        """Test that empty, None or whitespace-only API keys raise NoApiKeyException."""
+        with pytest.raises(NoApiKeyException, match=MISSING_KEY_MESSAGE):
+            ConversationTracker(api_key=api_key)
     
     def test_init_with_string_log_level(self, valid_api_key):
         """Test initialization with string log level."""
@@ -81,7 +96,7 @@ class TestConversationTrackerInitialization:
         """Test that individual parameters take precedence over config object."""
         config = Config()
         config.configure(
-            api_key="ags_11111111111111111111111111111111_111111",
+            api_key=EXISTING_CONFIG_KEY,
             conversation_id="config-conv-id",
             endpoint="https://config.example.com"
         )
@@ -111,60 +126,21 @@ class TestConversationTrackerInitialization:
         assert tracker.config.app_url == "https://custom.app.com"
         assert tracker.config.token_handler == TokenHandlerType.LLAMAINDEX
     
-    def test_init_default_values(self, valid_api_key):
-        """Test that default values are set correctly."""
-        tracker = ConversationTracker(api_key=valid_api_key)
-        
-        # Test default values
-        assert tracker.config.api_key == valid_api_key
-        assert tracker.config.conversation_id is None
-        assert tracker.config.endpoint is not None  # Should have default endpoint
-        assert tracker.config.log_level is not None  # Should have default log level
-    
-    def test_init_creates_empty_tracked_data(self, valid_api_key):
-        """Test that tracked data is initialized as empty dictionary."""
-        tracker = ConversationTracker(api_key=valid_api_key)
-        
-        assert isinstance(tracker._tracked_data, dict)
-        assert len(tracker._tracked_data) == 0
-    
-    def test_init_creates_lock_for_thread_safety(self, valid_api_key):
-        """Test that lock is created for thread safety."""
-        tracker = ConversationTracker(api_key=valid_api_key)
-        
-        assert hasattr(tracker, '_lock')
-        assert tracker._lock is not None
-        # Should be a threading.Lock instance
-        from threading import Lock
-        assert isinstance(tracker._lock, type(Lock()))
-    
-    def test_init_token_handler_defaults_to_none(self, valid_api_key):
-        """Test that token handler defaults to None."""
-        tracker = ConversationTracker(api_key=valid_api_key)
-        
-        assert tracker._token_handler is None
-    
     def test_init_with_none_config_creates_new_config(self, valid_api_key):
         """Test that None config creates new Config instance."""
         tracker = ConversationTracker(api_key=valid_api_key, config=None)
         
-        assert tracker.config is not None
         assert isinstance(tracker.config, Config)
         assert tracker.config.api_key == valid_api_key
     
-    def test_init_with_whitespace_api_key_raises_exception(self):
-        """Test that initialization with whitespace-only API key raises exception."""
-        with pytest.raises(NoApiKeyException):
-            ConversationTracker(api_key="   ")
-    
     def test_init_with_conversation_id_only_raises_exception(self):
         """Test that providing only conversation_id without api_key raises exception."""
-        with pytest.raises(NoApiKeyException):
+        with pytest.raises(NoApiKeyException, match=MISSING_KEY_MESSAGE):
             ConversationTracker(conversation_id="test-conv-id")
     
     def test_init_with_endpoint_only_raises_exception(self):
         """Test that providing only endpoint without api_key raises exception."""
-        with pytest.raises(NoApiKeyException):
+        with pytest.raises(NoApiKeyException, match=MISSING_KEY_MESSAGE):
             ConversationTracker(endpoint="https://test.com")
     
     def test_init_patch_llm_clients_called(self, valid_api_key):
@@ -173,35 +149,11 @@ class TestConversationTrackerInitialization:
             tracker = ConversationTracker(api_key=valid_api_key)
             mock_patch.assert_called_once()
     
-    def test_init_with_whitespace_api_key_raises_exception(self):
-        """Test that initialization with whitespace-only API key raises exception."""
-        with pytest.raises(NoApiKeyException):
-            ConversationTracker(api_key="   ")
-
-    def test_init_with_invalid_api_key_format(self):
-        """Test initialization with invalid API key format."""
-        with pytest.raises(InvalidApiKeyException):
-            ConversationTracker(api_key="invalid-key-format")
-
-    def test_init_with_api_key_with_spaces(self):
-        """Test initialization with API key containing spaces."""
-        with pytest.raises(InvalidApiKeyException):
-            ConversationTracker(api_key=" ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3 ")
-
-    def test_init_with_wrong_prefix(self):
-        """Test initialization with wrong prefix."""
-        with pytest.raises(InvalidApiKeyException):
-            ConversationTracker(api_key="wrong_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3")
-
-    def test_init_with_wrong_hash_length(self):
-        """Test initialization with wrong hash length."""
-        with pytest.raises(InvalidApiKeyException):
-            ConversationTracker(api_key="ags_1a2b3c4d5e6f7890abcdef123456789_a1b2c3")  # 31 chars instead of 32
-
-    def test_init_with_wrong_checksum_length(self):
-        """Test initialization with wrong checksum length."""
-        with pytest.raises(InvalidApiKeyException):
-            ConversationTracker(api_key="ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c34") 
+    @pytest.mark.parametrize("api_key", BAD_KEYS_INVALID)
+    def test_init_with_invalid_api_key_raises_exception(self, api_key):
+        """Test that malformed API keys raise InvalidApiKeyException."""
+        with pytest.raises(InvalidApiKeyException, match=f"API Key is invalid: {re.escape(api_key)}"):
+            ConversationTracker(api_key=api_key)
     
     def test_init_numeric_values_in_strings(self, valid_api_key):
         """Test initialization with numeric values as strings."""
@@ -219,7 +171,7 @@ class TestConversationTrackerInitialization:
         """Test that existing config object values are preserved when not overridden."""
         config = Config()
         config.configure(
-            api_key="ags_11111111111111111111111111111111_111111",
+            api_key=EXISTING_CONFIG_KEY,
             conversation_id="old-conv",
             endpoint="https://old.example.com",
             log_level=LogLevel.ERROR
@@ -246,7 +198,6 @@ class TestConversationTrackerInitialization:
             config=None
         )
         
-        assert isinstance(tracker.config, Config)
         assert tracker.config.api_key == valid_api_key
         assert tracker.config.conversation_id == "test-conv"
     
@@ -277,62 +228,50 @@ class TestConversationTrackerInitialization:
         
         assert tracker.config.token_handler == TokenHandlerType.LLAMAINDEX
     
-    def test_singleton_pattern_returns_same_instance(self, valid_api_key):
-        """Test that singleton pattern returns the same instance."""
-        # Reset singleton for this test
-        ConversationTracker._instance = None
-        ConversationTracker._instance_lock = __import__('threading').Lock()
-        
-        tracker1 = ConversationTracker(api_key=valid_api_key)
-        tracker2 = ConversationTracker(api_key=valid_api_key)
+    @pytest.mark.singleton
+    def test_singleton_identity_invariants(self, reset_singleton, valid_api_key):
+        """Test that repeated construction returns one shared, first-configured instance."""
+        tracker1 = ConversationTracker(
+            api_key=valid_api_key,
+            conversation_id="conv1",
+            endpoint="https://endpoint1.com"
+        )
+        tracker2 = ConversationTracker(
+            api_key="different_key",
+            conversation_id="conv2",
+            endpoint="https://endpoint2.com"
+        )
+        tracker3 = ConversationTracker()
         
-        # Should be the same instance
+        # Should be the same instance (singleton behavior)
         assert tracker1 is tracker2
-        assert id(tracker1) == id(tracker2)
-    
-    def test_singleton_reinitialization_prevented(self, valid_api_key):
-        """Test that singleton prevents re-initialization."""
-        # Reset singleton for this test
-        ConversationTracker._instance = None
-        ConversationTracker._instance_lock = __import__('threading').Lock()
+        assert tracker3 is tracker1
         
-        tracker1 = ConversationTracker(api_key=valid_api_key, conversation_id="conv1")
-        tracker2 = ConversationTracker(api_key=valid_api_key, conversation_id="conv2")
+        # Should share everything (because they're the same object)
+        assert tracker1._tracked_data is tracker2._tracked_data
+        assert tracker1._lock is tracker2._lock
+        assert tracker1._http_client is tracker2._http_client
         
-        # Both should be the same instance
-        assert tracker1 is tracker2
-        # conversation_id from first initialization should be preserved
-        assert tracker1.config.conversation_id == "conv1"
+        # Second initialization is completely ignored
+        assert tracker2.config.api_key == valid_api_key
         assert tracker2.config.conversation_id == "conv1"
-    
-    def test_auto_initialized_instance_with_env_api_key(self, monkeypatch, valid_api_key):
-        """Test that auto-initialized conversation_tracker works with API key from env."""
-        # Reset singleton
-        ConversationTracker._instance = None
-        ConversationTracker._instance_lock = __import__('threading').Lock()
-        
-        # Set API key in environment
-        monkeypatch.setenv("AGENTSIGHT_API_KEY", valid_api_key)
+        assert tracker2.config.endpoint == "https://endpoint1.com"
         
-        # Import to trigger auto-initialization
-        from agentsight.client.main_client import conversation_tracker
-        
-        # Should be initialized successfully
-        assert conversation_tracker is not None
-        assert conversation_tracker.config.api_key == valid_api_key
-        assert conversation_tracker._initialized is True
+        # To change config, must use configure()
+        tracker1.configure(conversation_id="conv2")
+        assert tracker2.config.conversation_id == "conv2"
     
-    def test_initialization_without_api_key_raises_exception(self, monkeypatch):
+    @pytest.mark.singleton
+    def test_initialization_without_api_key_raises_exception(self):
         """Test that creating tracker without API key raises exception."""
         # Reset singleton
         ConversationTracker._instance = None
-        ConversationTracker._instance_lock = __import__('threading').Lock()
+        ConversationTracker._instance_lock = Lock()
         
-        # Ensure no API key in environment
-        monkeypatch.delenv("AGENTSIGHT_API_KEY", raising=False)
+        # No API key in environment: the autouse conftest fixture already removed it
         
         # Creating instance should raise NoApiKeyException
-        with pytest.raises(NoApiKeyException):
+        with pytest.raises(NoApiKeyException, match=MISSING_KEY_MESSAGE):
             ConversationTracker()
 
     def test_configure_without_api_key_raises_exception(self, valid_api_key):
@@ -342,112 +281,35 @@ class TestConversationTrackerInitialization:
         with pytest.raises(NoApiKeyException, match="API key cannot be None"):
             tracker.configure(api_key=None)
 
-    def test_configure_updates_conversation_id(self, valid_api_key):
-        """Test that configure can update conversation_id."""
-        tracker = ConversationTracker(
-            api_key=valid_api_key,
-            conversation_id="conv-123"
-        )
-        
-        assert tracker.config.conversation_id == "conv-123"
-        
-        # Update conversation_id
-        tracker.configure(conversation_id="conv-456")
-        
-        assert tracker.config.conversation_id == "conv-456"
-        # API key should remain unchanged
-        assert tracker.config.api_key == valid_api_key
-
-    def test_configure_without_params_keeps_existing_config(self, valid_api_key):
-        """Test that configure without params doesn't change existing config."""
+    @pytest.mark.singleton
+    def test_configure_behavior(self, reset_singleton, valid_api_key):
+        """Test that configure only updates the parameters it is given."""
         tracker = ConversationTracker(
             api_key=valid_api_key,
             conversation_id="conv-123",
             endpoint="https://test.agentsight.io"
         )
         
-        original_api_key = tracker.config.api_key
-        original_conv_id = tracker.config.conversation_id
-        original_endpoint = tracker.config.endpoint
-        
-        # Call configure without params
+        # Configure without params keeps the existing config
         tracker.configure()
+        assert tracker.config.api_key == valid_api_key
+        assert tracker.config.conversation_id == "conv-123"
+        assert tracker.config.endpoint == "https://test.agentsight.io"
         
-        # All should remain the same
-        assert tracker.config.api_key == original_api_key
-        assert tracker.config.conversation_id == original_conv_id
-        assert tracker.config.endpoint == original_endpoint
-
-    def test_configure_updates_only_specified_params(self, valid_api_key):
-        """Test that configure only updates specified parameters."""
-        tracker = ConversationTracker(
-            api_key=valid_api_key,
-            conversation_id="conv-123",
-            endpoint="https://test.agentsight.io"
-        )
-        
-        # Update only conversation_id
+        # Updating conversation_id leaves everything else unchanged
         tracker.configure(conversation_id="conv-new")
-        
         assert tracker.config.conversation_id == "conv-new"
-        # Others should remain unchanged
         assert tracker.config.api_key == valid_api_key
         assert tracker.config.endpoint == "https://test.agentsight.io"
-
-    def test_singleton_returns_same_instance(self, valid_api_key):
-        """Test that multiple instantiations return the same singleton instance."""
-        tracker1 = ConversationTracker(api_key=valid_api_key, conversation_id="conv1")
-        tracker2 = ConversationTracker(api_key=valid_api_key, conversation_id="conv2")
-        
-        # Should be the same instance (singleton behavior)
-        assert tracker1 is tracker2
-        assert id(tracker1) == id(tracker2)
-        
-        # Should keep the first configuration (singleton ignores new params)
-        assert tracker1.config.conversation_id == "conv1"
-        assert tracker2.config.conversation_id == "conv1"
-        
-        # Should share everything (because they're the same object)
-        assert tracker1._tracked_data is tracker2._tracked_data
-        assert tracker1._lock is tracker2._lock
-        assert tracker1._http_client is tracker2._http_client
-
-    def test_singleton_uses_first_initialization_params(self, valid_api_key):
-        """Test that singleton uses parameters from first initialization only."""
-        # First initialization with conv1
-        tracker1 = ConversationTracker(api_key=valid_api_key, conversation_id="conv1")
-        
-        # Second "initialization" with conv2 - should be ignored
-        tracker2 = ConversationTracker(api_key="different_key", conversation_id="conv2")
-        
-        # Same instance
-        assert tracker1 is tracker2
         
-        # Uses first initialization values
-        assert tracker2.config.api_key == valid_api_key
-        assert tracker2.config.conversation_id == "conv1"
-
-    def test_singleton_can_be_reconfigured_via_configure(self, valid_api_key):
-        """Test that singleton can be reconfigured using configure() method."""
-        tracker = ConversationTracker(api_key=valid_api_key, conversation_id="conv1")
-        
-        assert tracker.config.conversation_id == "conv1"
-        
-        # Reconfigure the singleton (this is the correct way to change config)
-        tracker.configure(conversation_id="conv2")
-        
-        assert tracker.config.conversation_id == "conv2"
-        
-        # Any reference to the tracker will have the updated config
+        # Any reference to the singleton sees the updated config
         tracker_ref = ConversationTracker()
         assert tracker_ref is tracker
-        assert tracker_ref.config.conversation_id == "conv2"
+        assert tracker_ref.config.conversation_id == "conv-new"
 
-    def test_auto_initialized_instance_with_env_api_key(self, monkeypatch, valid_api_key):
+    @pytest.mark.singleton
+    def test_auto_initialized_instance_with_env_api_key(self, valid_api_key, monkeypatch):
         """Test that auto-initialized tracker works with API key from env."""
-        from agentsight.client.main_client import ConversationTracker
-        from threading import Lock
-        
         # MUST reset singleton before this test
         ConversationTracker._instance = None
         ConversationTracker._instance_lock = Lock()
@@ -462,47 +324,3 @@ class TestConversationTrackerInitialization:
         assert tracker is not None
         assert tracker.config.api_key == valid_api_key
         assert tracker._initialized is True
-
-    def test_module_level_tracker_is_singleton(self, valid_api_key):
-        """Test that module-level tracker instance follows singleton pattern."""
-        from agentsight.client.main_client import ConversationTracker
-        from threading import Lock
-        
-        # Reset singleton
-        ConversationTracker._instance = None
-        ConversationTracker._instance_lock = Lock()
-        
-        # Create an instance
-        tracker1 = ConversationTracker(api_key=valid_api_key)
-        
-        # Create another "instance"
-        tracker2 = ConversationTracker()
-        
-        # Should be the same
-        assert tracker1 is tracker2
-
-    def test_cannot_create_multiple_independent_instances(self, valid_api_key):
-        """Test that it's impossible to create independent instances."""
-        tracker1 = ConversationTracker(
-            api_key=valid_api_key,
-            conversation_id="conv1",
-            endpoint="https://endpoint1.com"
-        )
-        
-        tracker2 = ConversationTracker(
-            api_key="different_key",
-            conversation_id="conv2",
-            endpoint="https://endpoint2.com"
-        )
-        
-        # Must be the same instance
-        assert tracker1 is tracker2
-        
-        # Second initialization is completely ignored
-        assert tracker1.config.api_key == valid_api_key
-        assert tracker1.config.conversation_id == "conv1"
-        assert tracker1.config.endpoint == "https://endpoint1.com"
-        
-        # To change config, must use configure()
-        tracker1.configure(conversation_id="conv2")
-        assert tracker2.config.conversation_id == "conv2"
@@ -0,0 +1,27 @@
+import pytest
+
+
+class _RecordingStub:
+    """Minimal callable that records the arguments of every call."""
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture
+def send_payload_stub(tracker):
+    """Fixture replacing the tracker's send_payload with a recording stub."""
+    stub = _RecordingStub()
+    tracker._http_client.send_payload = stub
+    return stub
+
+@pytest.fixture
+def tracker_with_conv(tracker):
+    """Fixture providing ``(tracker, conversation_id)`` with that conversation already created."""
+    conv_id = "conv_123"
+    tracker.get_or_create_conversation(conv_id)
+    return tracker, conv_id
@@ -1,19 +1,22 @@
 import pytest
-from unittest.mock import patch
 from agentsight.client import ConversationTracker
 from agentsight.exceptions import (
     InvalidConversationDataException,
 )
 
+
+def _iso():
+    return "2024-01-01T12:00:00.000Z"
+
+
 class TestConversationTrackerTrackAction:
     """Test cases for track_action method."""
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_track_action_valid_data(self, mock_timestamp, tracker):
+    def test_track_action_valid_data(self, tracker_with_conv, monkeypatch):
         """Test tracking a valid action."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
+        tracker, conv_id = tracker_with_conv
+        monkeypatch.setattr('agentsight.client.main_client.get_iso_timestamp', _iso)
 
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_action(
             "calculate",
             started_at="2024-01-01T11:59:00.000Z",
@@ -23,8 +26,9 @@ class TestConversationTrackerTrackAction:
             response="4"
         )
 
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "action"
+        assert item["timestamp"] == "2024-01-01T12:00:00.000Z"
         assert item["data"]["action_name"] == "calculate"
         assert item["data"]["started_at"] == "2024-01-01T11:59:00.000Z"
         assert item["data"]["ended_at"] == "2024-01-01T12:00:00.000Z"
@@ -32,26 +36,20 @@ class TestConversationTrackerTrackAction:
         assert item["data"]["tools_used"] == {"calculator": "basic"}
         assert item["data"]["response"] == "4"
     
-    def test_track_action_empty_name_raises_exception(self, tracker):
+    @pytest.mark.parametrize("action_name", ["", "   ", None])
+    def test_track_action_empty_name_raises_exception(self, tracker, action_name):
         """Test that empty action name raises InvalidConversationDataException."""
         with pytest.raises(InvalidConversationDataException):
-            tracker.track_action("", "conv_123")
-        
-        with pytest.raises(InvalidConversationDataException):
-            tracker.track_action("   ", "conv_123")
-        
-        with pytest.raises(InvalidConversationDataException):
-            tracker.track_action(None, "conv_123")
+            tracker.track_action(action_name, "conv_123")
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_track_action_minimal_data(self, mock_timestamp, tracker):
+    def test_track_action_minimal_data(self, tracker_with_conv, monkeypatch):
         """Test tracking action with minimal required data."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
+        tracker, conv_id = tracker_with_conv
+        monkeypatch.setattr('agentsight.client.main_client.get_iso_timestamp', _iso)
         
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_action("test_action")
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["data"]["action_name"] == "test_action"
         assert item["data"]["metadata"] == {}
         
@@ -6,12 +6,20 @@ from agentsight.exceptions import (
 )
 from agentsight.enums import AttachmentMode
 
+# Base64 payloads are encoded once at import rather than in every test body
+_PDF_B64 = base64.b64encode(b"This is test PDF content").decode('utf-8')
+_MULTI_B64 = [
+    base64.b64encode(f"File {i+1} content".encode()).decode('utf-8')
+    for i in range(3)
+]
+_FORM_BYTES = b'PDF file content here'
+
 class TestConversationTrackerTrackAnswer:
     """Test cases for track_agent_message method."""
     
-    def test_track_agent_message_valid_data(self, tracker):
+    def test_track_agent_message_valid_data(self, tracker_with_conv):
         """Test tracking a valid answer."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, _ = tracker_with_conv
         tracker.track_agent_message("The answer is 4")
         
         # Check that data was stored
@@ -26,25 +34,21 @@ class TestConversationTrackerTrackAnswer:
         assert item["data"]["content"] == "The answer is 4"
         assert item["data"]["sender"] == "agent"
 
-    def test_track_agent_message_invalid_data_raises_exception(self, tracker):
+    def test_track_agent_message_invalid_data_raises_exception(self, tracker_with_conv):
         """Test that invalid answer data raises InvalidAnswerDataException."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, _ = tracker_with_conv
         
         with pytest.raises(InvalidAnswerDataException):
             tracker.track_agent_message("")
 
-    def test_track_agent_message_with_base64_attachments(self, tracker):
+    def test_track_agent_message_with_base64_attachments(self, tracker_with_conv):
         """Test tracking an answer with base64 attachments."""
-        tracker.get_or_create_conversation("conv_123")
-        
-        # Use actual valid base64 data
-        file_content = b"This is test PDF content"
-        base64_data = base64.b64encode(file_content).decode('utf-8')
+        tracker, conv_id = tracker_with_conv
         
         attachments = [
             {
                 'filename': 'test.pdf',
-                'data': base64_data,
+                'data': _PDF_B64,
                 'mime_type': 'application/pdf'
             }
         ]
@@ -57,7 +61,6 @@ class TestConversationTrackerTrackAnswer:
         )
         
         # Check that data was stored with attachments
-        conv_id = tracker.config.conversation_id
         assert conv_id in tracker._tracked_data
         assert len(tracker._tracked_data[conv_id]["items"]) == 2
         
@@ -70,14 +73,14 @@ class TestConversationTrackerTrackAnswer:
         assert item["data"]["attachments"][0]["filename"] == "test.pdf"
         assert item["data"]["attachment_mode"] == AttachmentMode.BASE64.value
 
-    def test_track_agent_message_with_form_data_attachments(self, tracker):
+    def test_track_agent_message_with_form_data_attachments(self, tracker_with_conv):
         """Test tracking an answer with form_data attachments."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         
         # Use BytesIO for form_data mode
         attachments = [
             {
-                'data': BytesIO(b'PDF file content here'),
+                'data': BytesIO(_FORM_BYTES),
                 'filename': 'document.pdf'
             }
         ]
@@ -90,7 +93,6 @@ class TestConversationTrackerTrackAnswer:
         )
         
         # Check that data was stored with attachments
-        conv_id = tracker.config.conversation_id
         assert conv_id in tracker._tracked_data
         item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "answer"
@@ -98,20 +100,18 @@ class TestConversationTrackerTrackAnswer:
         assert item["data"]["attachment_mode"] == AttachmentMode.FORM_DATA.value
         assert len(item["data"]["attachments"]) == 1
 
-    def test_track_agent_message_with_multiple_attachments(self, tracker):
+    def test_track_agent_message_with_multiple_attachments(self, tracker_with_conv):
         """Test tracking an answer with multiple attachments."""
-        tracker.get_or_create_conversation("conv_123")
-        
-        # Create multiple valid base64 attachments
-        attachments = []
-        for i in range(3):
-            file_content = f"File {i+1} content".encode()
-            base64_data = base64.b64encode(file_content).decode('utf-8')
-            attachments.append({
+        tracker, conv_id = tracker_with_conv
+        
+        attachments = [
+            {
                 'filename': f'file{i+1}.pdf',
-                'data': base64_data,
+                'data': data,
                 'mime_type': 'application/pdf'
-            })
+            }
+            for i, data in enumerate(_MULTI_B64)
+        ]
         
         tracker.track_agent_message(
             message="Here are multiple documents",
@@ -120,31 +120,29 @@ class TestConversationTrackerTrackAnswer:
         )
         
         # Check that all attachments were stored
-        conv_id = tracker.config.conversation_id
         item = tracker._tracked_data[conv_id]["items"][1]
         assert len(item["data"]["attachments"]) == 3
         assert all(att["filename"] in ['file1.pdf', 'file2.pdf', 'file3.pdf'] 
                   for att in item["data"]["attachments"])
 
-    def test_track_agent_message_without_attachments(self, tracker):
+    def test_track_agent_message_without_attachments(self, tracker_with_conv):
         """Test that tracking without attachments still works (backward compatibility)."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         tracker.track_agent_message(
             message="Simple message without attachments",
             metadata={"simple": True}
         )
         
         # Check that message was stored without attachments
-        conv_id = tracker.config.conversation_id
         item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "answer"
         assert "attachments" not in item["data"]
         assert "attachment_mode" not in item["data"]
         assert item["data"]["content"] == "Simple message without attachments"
 
-    def test_track_agent_message_invalid_attachment_mode_raises_exception(self, tracker):
+    def test_track_agent_message_invalid_attachment_mode_raises_exception(self, tracker_with_conv):
         """Test that invalid attachment mode raises ValueError."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, _ = tracker_with_conv
         
         attachments = [{'filename': 'test.pdf', 'data': 'data'}]
         
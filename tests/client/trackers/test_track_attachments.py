@@ -1,28 +1,29 @@
+import base64
 from agentsight.client import ConversationTracker
 from agentsight.enums import AttachmentMode
 from io import BytesIO
 
+# Payloads built once at import
+_TEXT_BYTES = b"test content"
+_TEXT_B64 = base64.b64encode(_TEXT_BYTES).decode('utf-8')
+
 class TestConversationTrackerTrackAttachments:
     """Test cases for track_attachments method."""
     
-    def test_track_attachments_base64_mode(self, tracker):
+    def test_track_attachments_base64_mode(self, tracker_with_conv):
         """Test tracking attachments in base64 mode."""
-        # Use valid base64 data that will pass validation
-        import base64
-        base64_data = base64.b64encode(b"test content").decode('utf-8')
-        
+        tracker, conv_id = tracker_with_conv
         attachments = [
-            {"filename": "test.txt", "mime_type": "text/plain", "data": base64_data}
+            {"filename": "test.txt", "mime_type": "text/plain", "data": _TEXT_B64}
         ]
         
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_attachments(attachments, mode="base64")
         
         # Check that data was stored
-        assert "conv_123" in tracker._tracked_data
-        assert len(tracker._tracked_data["conv_123"]["items"]) == 2
+        assert conv_id in tracker._tracked_data
+        assert len(tracker._tracked_data[conv_id]["items"]) == 2
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         print(item)
         assert item["type"] == "attachments"
         assert item["data"]["mode"] == AttachmentMode.BASE64.value
@@ -33,21 +34,21 @@ class TestConversationTrackerTrackAttachments:
         assert attachment["filename"] == "test.txt"
         assert attachment["mime_type"] == "text/plain"
 
-    def test_track_attachments_form_data_mode(self, tracker):
+    def test_track_attachments_form_data_mode(self, tracker_with_conv):
         """Test tracking attachments in form_data mode."""
+        tracker, conv_id = tracker_with_conv
         # Use BytesIO data that will pass validation for form_data mode
         attachments = [
-            {"filename": "test.txt", "mime_type": "text/plain", "data": BytesIO(b"test content")}
+            {"filename": "test.txt", "mime_type": "text/plain", "data": BytesIO(_TEXT_BYTES)}
         ]
         
-        tracker.get_or_create_conversation("conv_123")
-        tracker.track_attachments(attachments, "conv_123", mode="form_data")
+        tracker.track_attachments(attachments, conv_id, mode="form_data")
         
         # Check that data was stored
-        assert "conv_123" in tracker._tracked_data
-        assert len(tracker._tracked_data["conv_123"]["items"]) == 2
+        assert conv_id in tracker._tracked_data
+        assert len(tracker._tracked_data[conv_id]["items"]) == 2
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "attachments"
         assert item["data"]["mode"] == AttachmentMode.FORM_DATA.value
         assert len(item["data"]["attachments"]) == 1
@@ -1,42 +1,39 @@
 import pytest
-from unittest.mock import patch
 from agentsight.client import ConversationTracker
 from agentsight.exceptions import (
     InvalidConversationDataException,
 )
 
+
+def _iso():
+    return "2024-01-01T12:00:00.000Z"
+
+
 class TestConversationTrackerTrackButton:
     """Test cases for track_button method."""
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_track_button_valid_data(self, mock_timestamp, tracker):
+    def test_track_button_valid_data(self, tracker_with_conv, monkeypatch):
         """Test tracking a valid button click."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
+        tracker, conv_id = tracker_with_conv
+        monkeypatch.setattr('agentsight.client.main_client.get_iso_timestamp', _iso)
         
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_button("submit", "Submit Form", "submit_action")
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "button"
+        assert item["timestamp"] == "2024-01-01T12:00:00.000Z"
         assert item["data"]["button_event"] == "submit"
         assert item["data"]["label"] == "Submit Form"
         assert item["data"]["value"] == "submit_action"
     
-    def test_track_button_empty_fields_raise_exception(self, tracker):
+    @pytest.mark.parametrize("button_event, label, value", [
+        ("", "Label", "value"),     # Empty button_event
+        ("event", "", "value"),     # Empty label
+        ("event", "Label", ""),     # Empty value
+        ("   ", "Label", "value"),  # Whitespace only
+    ])
+    def test_track_button_empty_fields_raise_exception(self, tracker_with_conv, button_event, label, value):
         """Test that empty button fields raise InvalidConversationDataException."""
-        tracker.get_or_create_conversation("conv_123")
-        # Empty button_event
-        with pytest.raises(InvalidConversationDataException):
-            tracker.track_button("", "Label", "value")
-        
-        # Empty label
-        with pytest.raises(InvalidConversationDataException):
-            tracker.track_button("event", "", "value")
-        
-        # Empty value
-        with pytest.raises(InvalidConversationDataException):
-            tracker.track_button("event", "Label", "")
-        
-        # Whitespace only
+        tracker, _ = tracker_with_conv
         with pytest.raises(InvalidConversationDataException):
-            tracker.track_button("   ", "Label", "value")
+            tracker.track_button(button_event, label, value)
@@ -1,28 +1,24 @@
 import pytest
-from unittest.mock import patch, MagicMock
 from agentsight.client import ConversationTracker
 
 
 class TestConversationTrackerInitializeConversation:
     """Test cases for initialize_conversation method."""
     
-    def test_initialize_conversation_basic(self, tracker):
+    def test_initialize_conversation_basic(self, tracker, send_payload_stub):
         """Test initializing a conversation with just conversation_id."""
         conversation_id = "conv_init_123"
         
-        # Mock the send_payload method on the existing instance
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(conversation_id)
         
         # Verify send_payload was called
-        tracker._http_client.send_payload.assert_called_once()
+        assert len(send_payload_stub.calls) == 1
         
         # Check the arguments
-        call_args = tracker._http_client.send_payload.call_args
-        assert call_args[0][0] == 'conversation'
+        args, _ = send_payload_stub.calls[0]
+        assert args[0] == 'conversation'
         
-        payload = call_args[0][1]
+        payload = args[1]
         assert payload["conversation_id"] == conversation_id
         assert payload["is_used"] is False
         assert payload["customer_id"] is None
@@ -32,26 +28,23 @@ class TestConversationTrackerInitializeConversation:
         assert payload["language"] is None
         assert payload["metadata"] is None
     
-    def test_initialize_conversation_with_customer_id(self, tracker):
+    def test_initialize_conversation_with_customer_id(self, tracker, send_payload_stub):
         """Test initializing a conversation with customer_id."""
         conversation_id = "conv_init_456"
         customer_id = "customer_789"
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(
             conversation_id=conversation_id,
             customer_id=customer_id
         )
         
-        call_args = tracker._http_client.send_payload.call_args
-        payload = call_args[0][1]
+        payload = send_payload_stub.calls[-1][0][1]
         
         assert payload["conversation_id"] == conversation_id
         assert payload["customer_id"] == customer_id
         assert payload["is_used"] is False
     
-    def test_initialize_conversation_with_all_parameters(self, tracker):
+    def test_initialize_conversation_with_all_parameters(self, tracker, send_payload_stub):
         """Test initializing a conversation with all parameters."""
         conversation_id = "conv_full_init"
         customer_id = "customer_123"
@@ -61,8 +54,6 @@ class TestConversationTrackerInitializeConversation:
         language = "en"
         metadata = {"plan": "premium", "region": "us-east"}
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(
             conversation_id=conversation_id,
             customer_id=customer_id,
@@ -73,8 +64,7 @@ class TestConversationTrackerInitializeConversation:
             metadata=metadata
         )
         
-        call_args = tracker._http_client.send_payload.call_args
-        payload = call_args[0][1]
+        payload = send_payload_stub.calls[-1][0][1]
         
         assert payload["conversation_id"] == conversation_id
         assert payload["customer_id"] == customer_id
@@ -85,20 +75,17 @@ class TestConversationTrackerInitializeConversation:
         assert payload["metadata"] == metadata
         assert payload["is_used"] is False
     
-    def test_initialize_conversation_with_partial_parameters(self, tracker):
+    def test_initialize_conversation_with_partial_parameters(self, tracker, send_payload_stub):
         """Test initializing a conversation with some optional parameters."""
         conversation_id = "conv_partial_init"
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(
             conversation_id=conversation_id,
             device="desktop",
             language="es"
         )
         
-        call_args = tracker._http_client.send_payload.call_args
-        payload = call_args[0][1]
+        payload = send_payload_stub.calls[-1][0][1]
         
         assert payload["conversation_id"] == conversation_id
         assert payload["device"] == "desktop"
@@ -106,79 +93,68 @@ class TestConversationTrackerInitializeConversation:
         assert payload["customer_id"] is None
         assert payload["source"] is None
     
-    def test_initialize_conversation_with_empty_metadata(self, tracker):
+    def test_initialize_conversation_with_empty_metadata(self, tracker, send_payload_stub):
         """Test initializing a conversation with empty metadata dict."""
         conversation_id = "conv_empty_meta_init"
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(
             conversation_id=conversation_id,
             metadata={}
         )
         
-        call_args = tracker._http_client.send_payload.call_args
-        payload = call_args[0][1]
+        payload = send_payload_stub.calls[-1][0][1]
         
         assert payload["metadata"] == {}
         assert payload["is_used"] is False
     
-    def test_initialize_conversation_sends_immediately(self, tracker):
+    def test_initialize_conversation_sends_immediately(self, tracker, send_payload_stub):
         """Test that initialize_conversation sends immediately, not stores."""
         conversation_id = "conv_immediate"
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(conversation_id)
         
         # Should send immediately
-        tracker._http_client.send_payload.assert_called_once()
+        assert len(send_payload_stub.calls) == 1
         
         # Should NOT store in tracked_data
         assert conversation_id not in tracker._tracked_data
     
-    def test_initialize_conversation_multiple_times(self, tracker):
+    def test_initialize_conversation_multiple_times(self, tracker, send_payload_stub):
         """Test initializing multiple conversations."""
         conv_id_1 = "conv_init_001"
         conv_id_2 = "conv_init_002"
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation(conv_id_1, customer_id="customer_a")
         tracker.initialize_conversation(conv_id_2, customer_id="customer_b")
         
         # Should be called twice
-        assert tracker._http_client.send_payload.call_count == 2
+        assert len(send_payload_stub.calls) == 2
         
         # Check first call
-        first_call = tracker._http_client.send_payload.call_args_list[0]
-        assert first_call[0][1]["conversation_id"] == conv_id_1
-        assert first_call[0][1]["customer_id"] == "customer_a"
+        first_payload = send_payload_stub.calls[0][0][1]
+        assert first_payload["conversation_id"] == conv_id_1
+        assert first_payload["customer_id"] == "customer_a"
         
         # Check second call
-        second_call = tracker._http_client.send_payload.call_args_list[1]
-        assert second_call[0][1]["conversation_id"] == conv_id_2
-        assert second_call[0][1]["customer_id"] == "customer_b"
+        second_payload = send_payload_stub.calls[1][0][1]
+        assert second_payload["conversation_id"] == conv_id_2
+        assert second_payload["customer_id"] == "customer_b"
     
-    def test_initialize_conversation_is_used_always_false(self, tracker):
+    def test_initialize_conversation_is_used_always_false(self, tracker, send_payload_stub):
         """Test that is_used is always False for initialize_conversation."""
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation("conv_001")
         tracker.initialize_conversation("conv_002", customer_id="customer_123")
         tracker.initialize_conversation("conv_003", metadata={"test": "value"})
         
         # Check all calls have is_used = False
-        for call in tracker._http_client.send_payload.call_args_list:
-            payload = call[0][1]
+        for args, _ in send_payload_stub.calls:
+            payload = args[1]
             assert payload["is_used"] is False
     
-    def test_initialize_conversation_does_not_update_config(self, tracker):
+    def test_initialize_conversation_does_not_update_config(self, tracker, send_payload_stub):
         """Test that initialize_conversation does not update tracker config."""
         original_conv_id = tracker.config.conversation_id
         
-        tracker._http_client.send_payload = MagicMock()
-        
         tracker.initialize_conversation("conv_new_init")
         
         # Config should not change
@@ -6,20 +6,40 @@ from agentsight.exceptions import (
 )
 from agentsight.enums import AttachmentMode
 
+_ID_BYTES = b'ID document binary content'
+_TEXT_BYTES = b'test content'
+_EXPECTED_PDFS = frozenset({'id.pdf', 'proof.pdf', 'bank.pdf'})
+
+# Base64 payloads are encoded once at import rather than in every test body
+_PDF_B64 = base64.b64encode(b"Document content here").decode('utf-8')
+_MULTI_B64 = {
+    name: base64.b64encode(f"Content of {name}".encode()).decode('utf-8')
+    for name in _EXPECTED_PDFS
+}
+_INVALID_QUESTIONS = ("", "   ", "\t", "\n", "\r\n")
+_SPECIAL_QUESTIONS = (
+    "What's the meaning of life?",
+    "How do you say 'hello' in 中文?",
+    "What about émojis? 😀🎉",
+    "Math: 2+2=4, right?",
+    "Newline\nQuestion",
+    "Tab\tQuestion",
+)
+
 
 class TestConversationTrackerTrackQuestion:
     """Test cases for track_human_message method."""
     
-    def test_track_human_message_valid_data(self, tracker):
+    def test_track_human_message_valid_data(self, tracker_with_conv):
         """Test tracking a valid question."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         tracker.track_human_message("What is 2+2?")
         
         # Check that data was stored
-        assert "conv_123" in tracker._tracked_data
-        assert len(tracker._tracked_data["conv_123"]["items"]) == 2
+        assert conv_id in tracker._tracked_data
+        assert len(tracker._tracked_data[conv_id]["items"]) == 2
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "question"
         assert "timestamp" in item
         assert isinstance(item["timestamp"], str)
@@ -28,124 +48,95 @@ class TestConversationTrackerTrackQuestion:
         assert item["data"]["sender"] == "end_user"
         assert item["data"]["metadata"] == {}
     
-    def test_track_human_message_invalid_data_raises_exception(self, tracker):
-        """Test that invalid question data raises InvalidQuestionDataException."""
-        tracker.get_or_create_conversation("conv_123")
-        with pytest.raises(InvalidQuestionDataException):
-            tracker.track_human_message("")
-        
+    @pytest.mark.parametrize("question", _INVALID_QUESTIONS)
+    def test_track_human_message_invalid_data_raises_exception(self, tracker_with_conv, question):
+        """Test that empty or whitespace-only questions raise InvalidQuestionDataException."""
+        tracker, _ = tracker_with_conv
         with pytest.raises(InvalidQuestionDataException):
-            tracker.track_human_message("   ")
+            tracker.track_human_message(question)
     
-    def test_track_human_message_with_metadata(self, tracker):
+    def test_track_human_message_with_metadata(self, tracker_with_conv):
         """Test tracking question with metadata."""
+        tracker, conv_id = tracker_with_conv
         metadata = {"source": "test", "priority": "high"}
         
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_human_message("Test question", metadata=metadata)
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["data"]["metadata"] == metadata
     
-    def test_track_human_message_with_none_metadata(self, tracker):
+    def test_track_human_message_with_none_metadata(self, tracker_with_conv):
         """Test tracking question with None metadata."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         tracker.track_human_message("Test question", metadata=None)
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["data"]["metadata"] == {}
     
-    def test_track_human_message_with_empty_metadata(self, tracker):
+    def test_track_human_message_with_empty_metadata(self, tracker_with_conv):
         """Test tracking question with empty metadata."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         tracker.track_human_message("Test question", metadata={})
         
-        item = tracker._tracked_data["conv_123"]["items"][1]
+        item = tracker._tracked_data[conv_id]["items"][1]
         assert item["data"]["metadata"] == {}
     
-    def test_track_multiple_questions_preserves_order(self, tracker):
+    def test_track_multiple_questions_preserves_order(self, tracker_with_conv):
         """Test that multiple questions are stored in order."""
+        tracker, conv_id = tracker_with_conv
         questions = ["First question", "Second question", "Third question"]
 
-        tracker.get_or_create_conversation("conv_123")
-
         for question in questions:
             tracker.track_human_message(question)
         
         # Check that all questions were stored (1 conv + 3 questions)
-        assert len(tracker._tracked_data["conv_123"]["items"]) == 4
+        assert len(tracker._tracked_data[conv_id]["items"]) == 4
         
         # Check that order is preserved
         for i, question in enumerate(questions):
-            item = tracker._tracked_data["conv_123"]["items"][i+1]
+            item = tracker._tracked_data[conv_id]["items"][i+1]
             assert item["data"]["content"] == question
             assert item["type"] == "question"
     
-    def test_track_human_message_timestamp_progression(self, tracker):
+    def test_track_human_message_timestamp_progression(self, tracker_with_conv, monkeypatch):
         """Test that timestamps progress correctly for sequential questions."""
-        import time
+        tracker, conv_id = tracker_with_conv
+        timestamps = iter([
+            "2024-01-01T12:00:00.000Z",
+            "2024-01-01T12:00:00.010Z",
+        ])
+        monkeypatch.setattr('agentsight.client.main_client.get_iso_timestamp', timestamps.__next__)
         
-        tracker.get_or_create_conversation("conv_123")
         tracker.track_human_message("First question")
-        time.sleep(0.01)  # Small delay to ensure different timestamps
         tracker.track_human_message("Second question")
         
-        items = tracker._tracked_data["conv_123"]["items"]
+        items = tracker._tracked_data[conv_id]["items"]
         assert len(items) == 3
         
-        # Check that timestamps are different
-        timestamp1 = items[0]["timestamp"]
-        timestamp2 = items[1]["timestamp"]
-        assert timestamp1 != timestamp2
-        
-        # Check that both timestamps are valid strings
-        assert isinstance(timestamp1, str)
-        assert isinstance(timestamp2, str)
-        assert len(timestamp1) > 0
-        assert len(timestamp2) > 0
+        # Each question gets its own timestamp, in call order
+        timestamp1 = items[1]["timestamp"]
+        timestamp2 = items[2]["timestamp"]
+        assert timestamp1 == "2024-01-01T12:00:00.000Z"
+        assert timestamp2 == "2024-01-01T12:00:00.010Z"
+        assert timestamp1 < timestamp2
     
-    def test_track_human_message_with_special_characters(self, tracker):
-        """Test tracking questions with special characters."""
-        special_questions = [
-            "What's the meaning of life?",
-            "How do you say 'hello' in 中文?",
-            "What about émojis? 😀🎉",
-            "Math: 2+2=4, right?",
-            "Newline\nQuestion",
-            "Tab\tQuestion"
-        ]
-        
-        tracker.get_or_create_conversation("conv_123")
-        for i, question in enumerate(special_questions):
-            tracker.track_human_message(question)
+    @pytest.mark.parametrize("question", _SPECIAL_QUESTIONS)
+    def test_track_human_message_with_special_characters(self, tracker_with_conv, question):
+        """Test that special characters in questions are preserved."""
+        tracker, conv_id = tracker_with_conv
+        tracker.track_human_message(question)
         
-        # Check that all special characters are preserved
-        for i, question in enumerate(special_questions):
-            conv_id = f"conv_123"
-            item = tracker._tracked_data[conv_id]["items"][i+1]
-            assert item["data"]["content"] == question
+        item = tracker._tracked_data[conv_id]["items"][1]
+        assert item["data"]["content"] == question
     
-    def test_track_human_message_validates_empty_content(self, tracker):
-        """Test that empty content validation works correctly."""
-        invalid_questions = ["", "   ", "\t", "\n", "\r\n"]
-        
-        tracker.get_or_create_conversation("conv_123")
-        for question in invalid_questions:
-            with pytest.raises(InvalidQuestionDataException):
-                tracker.track_human_message(question)
-
-    def test_track_human_message_with_base64_attachments(self, tracker):
+    def test_track_human_message_with_base64_attachments(self, tracker_with_conv):
         """Test tracking a question with base64 attachments."""
-        tracker.get_or_create_conversation("conv_123")
-        
-        # Use actual valid base64 data
-        file_content = b"Document content here"
-        base64_data = base64.b64encode(file_content).decode('utf-8')
+        tracker, conv_id = tracker_with_conv
         
         attachments = [
             {
                 'filename': 'document.pdf',
-                'data': base64_data,
+                'data': _PDF_B64,
                 'mime_type': 'application/pdf'
             }
         ]
@@ -158,7 +149,6 @@ class TestConversationTrackerTrackQuestion:
         )
         
         # Check that data was stored with attachments
-        conv_id = tracker.config.conversation_id
         assert conv_id in tracker._tracked_data
         assert len(tracker._tracked_data[conv_id]["items"]) == 2
         
@@ -171,14 +161,14 @@ class TestConversationTrackerTrackQuestion:
         assert item["data"]["attachments"][0]["filename"] == "document.pdf"
         assert item["data"]["attachment_mode"] == AttachmentMode.BASE64.value
 
-    def test_track_human_message_with_form_data_attachments(self, tracker):
+    def test_track_human_message_with_form_data_attachments(self, tracker_with_conv):
         """Test tracking a question with form_data attachments."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         
         # Use BytesIO for form_data mode
         attachments = [
             {
-                'data': BytesIO(b'ID document binary content'),
+                'data': BytesIO(_ID_BYTES),
                 'filename': 'upload.pdf'
             }
         ]
@@ -191,28 +181,24 @@ class TestConversationTrackerTrackQuestion:
         )
         
         # Check that data was stored with attachments
-        conv_id = tracker.config.conversation_id
         assert conv_id in tracker._tracked_data
         item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "question"
         assert "attachments" in item["data"]
         assert item["data"]["attachment_mode"] == AttachmentMode.FORM_DATA.value
 
-    def test_track_human_message_with_multiple_attachments(self, tracker):
+    def test_track_human_message_with_multiple_attachments(self, tracker_with_conv):
         """Test tracking a question with multiple attachments."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         
-        # Create multiple valid base64 attachments
-        attachments = []
-        file_names = ['id.pdf', 'proof.pdf', 'bank.pdf']
-        for name in file_names:
-            file_content = f"Content of {name}".encode()
-            base64_data = base64.b64encode(file_content).decode('utf-8')
-            attachments.append({
+        attachments = [
+            {
                 'filename': name,
-                'data': base64_data,
+                'data': data,
                 'mime_type': 'application/pdf'
-            })
+            }
+            for name, data in _MULTI_B64.items()
+        ]
         
         tracker.track_human_message(
             message="Here are all my verification documents",
@@ -221,31 +207,28 @@ class TestConversationTrackerTrackQuestion:
         )
         
         # Check that all attachments were stored
-        conv_id = tracker.config.conversation_id
         item = tracker._tracked_data[conv_id]["items"][1]
         assert len(item["data"]["attachments"]) == 3
-        assert all(att["filename"] in ['id.pdf', 'proof.pdf', 'bank.pdf'] 
-                  for att in item["data"]["attachments"])
+        assert all(att["filename"] in _EXPECTED_PDFS for att in item["data"]["attachments"])
 
-    def test_track_human_message_without_attachments(self, tracker):
+    def test_track_human_message_without_attachments(self, tracker_with_conv):
         """Test that tracking without attachments still works (backward compatibility)."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         tracker.track_human_message(
             message="Simple question without attachments",
             metadata={"simple": True}
         )
         
         # Check that message was stored without attachments
-        conv_id = tracker.config.conversation_id
         item = tracker._tracked_data[conv_id]["items"][1]
         assert item["type"] == "question"
         assert "attachments" not in item["data"]
         assert "attachment_mode" not in item["data"]
         assert item["data"]["content"] == "Simple question without attachments"
 
-    def test_track_human_message_invalid_attachment_mode_raises_exception(self, tracker):
+    def test_track_human_message_invalid_attachment_mode_raises_exception(self, tracker_with_conv):
         """Test that invalid attachment mode raises ValueError."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, _ = tracker_with_conv
         
         attachments = [{'filename': 'test.pdf', 'data': 'data'}]
         
@@ -256,13 +239,13 @@ class TestConversationTrackerTrackQuestion:
                 attachment_mode='invalid_mode'
             )
 
-    def test_track_human_message_with_form_dash_data_mode(self, tracker):
+    def test_track_human_message_with_form_dash_data_mode(self, tracker_with_conv):
         """Test that 'form-data' (with dash) is accepted as valid mode."""
-        tracker.get_or_create_conversation("conv_123")
+        tracker, conv_id = tracker_with_conv
         
         attachments = [
             {
-                'data': BytesIO(b'test content'),
+                'data': BytesIO(_TEXT_BYTES),
                 'filename': 'test.pdf'
             }
         ]
@@ -274,7 +257,6 @@ class TestConversationTrackerTrackQuestion:
             attachment_mode='form-data'  # Note: with dash
         )
         
-        conv_id = tracker.config.conversation_id
         item = tracker._tracked_data[conv_id]["items"][1]
         # Should be normalized to FORM_DATA
         assert item["data"]["attachment_mode"] == AttachmentMode.FORM_DATA.value
\ No newline at end of file
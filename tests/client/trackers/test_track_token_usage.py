@@ -1,14 +1,22 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from agentsight.client import ConversationTracker
 from agentsight.config import Config
 from agentsight.enums import TokenHandlerType, LogLevel
 from agentsight.exceptions import NoDataToSendException, InvalidApiKeyException
 
 
+_FIXED_TIMESTAMP = "2024-01-01T12:00:00.000Z"
+
+
 class TestConversationTrackerTokenUsage:
     """Test cases for token usage tracking methods."""
     
+    @pytest.fixture(autouse=True)
+    def _fixed_timestamp(self, monkeypatch):
+        """Pin the tracker's timestamps for every test in the class."""
+        monkeypatch.setattr('agentsight.client.main_client.get_iso_timestamp', lambda: _FIXED_TIMESTAMP)
+    
     def test_token_handler_initializes_as_none_by_default(self, valid_api_key):
         """Test that token handler starts as None when not configured."""
         tracker = ConversationTracker(api_key=valid_api_key)
@@ -46,9 +54,10 @@ class TestConversationTrackerTokenUsage:
         
         assert tracker.config.token_handler == TokenHandlerType.LLAMAINDEX
     
-    @patch.dict('os.environ', {'AGENTSIGHT_TOKEN_HANDLER_TYPE': 'llamaindex'})
-    def test_token_handler_from_env_variable(self, valid_api_key):
+    def test_token_handler_from_env_variable(self, valid_api_key, monkeypatch):
         """Test that token handler can be set via environment variable."""
+        monkeypatch.setenv('AGENTSIGHT_TOKEN_HANDLER_TYPE', 'llamaindex')
+        
         # Config should pick up from env var
         config = Config(api_key=valid_api_key)
         tracker = ConversationTracker(config=config)
@@ -179,11 +188,8 @@ class TestConversationTrackerTokenUsage:
         }
 
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_add_token_usage_inserts_before_last_item(self, mock_timestamp, tracker):
+    def test_add_token_usage_inserts_before_last_item(self, tracker):
         """Test that _add_token_usage inserts before last item."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
-        
         conv_id = "conv_123"
         tracker.get_or_create_conversation(conv_id)
         
@@ -213,6 +219,7 @@ class TestConversationTrackerTokenUsage:
         # Token usage should be inserted at index 1 (before last item)
         token_item = items[1]
         assert token_item["type"] == "action"
+        assert token_item["timestamp"] == _FIXED_TIMESTAMP
         assert token_item["data"]["action_name"] == "token_usage"
         assert token_item["data"]["conversation_id"] == conv_id
         assert token_item["data"]["metadata"] == {
@@ -230,11 +237,8 @@ class TestConversationTrackerTokenUsage:
         assert items[0]["type"] == "question"
         assert items[0]["data"]["content"] == "test"
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_add_token_usage_appends_with_single_item(self, mock_timestamp, tracker):
+    def test_add_token_usage_appends_with_single_item(self, tracker):
         """Test that _add_token_usage appends when there's only one item."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
-        
         conv_id = "conv_456"
         tracker.get_or_create_conversation(conv_id)
         
@@ -255,11 +259,8 @@ class TestConversationTrackerTokenUsage:
         assert items[1]["data"]["action_name"] == "token_usage"
         assert items[1]["data"]["metadata"]["total_tokens"] == 100
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_add_token_usage_appends_with_no_items(self, mock_timestamp, tracker):
+    def test_add_token_usage_appends_with_no_items(self, tracker):
         """Test that _add_token_usage appends when there are no items."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
-        
         conv_id = "conv_789"
         tracker.get_or_create_conversation(conv_id)
         
@@ -273,11 +274,8 @@ class TestConversationTrackerTokenUsage:
         assert items[0]["type"] == "action"
         assert items[0]["data"]["action_name"] == "token_usage"
     
-    @patch('agentsight.helpers.get_iso_timestamp')
-    def test_add_token_usage_with_no_token_handler(self, mock_timestamp, tracker):
+    def test_add_token_usage_with_no_token_handler(self, tracker):
         """Test _add_token_usage when no tokens have been tracked."""
-        mock_timestamp.return_value = "2024-01-01T12:00:00.000Z"
-        
         conv_id = "conv_no_tokens"
         tracker.get_or_create_conversation(conv_id)
         
@@ -1,25 +1,70 @@
+import ast
 import pytest
-from unittest.mock import MagicMock
 from threading import Lock
 from agentsight.config import Config
-from io import BytesIO
 from agentsight.client import ConversationTracker
-from unittest.mock import Mock
+from agentsight.client.api_client import AgentSightAPI
+from agentsight.client.conversation_manager_client import ConversationManager
+
+_ENV_VARS_TO_CLEAR = (
+    "AGENTSIGHT_TOKEN_HANDLER_TYPE",
+    "AGENTSIGHT_API_KEY",
+    "AGENTSIGHT_CONVERSATION_ID",
+)
+
+_LOCK_TYPE = type(Lock())
+
+def _reset_singleton_class(cls):
+    """Drop a client's singleton instance, keeping its lock unless a test left it held or replaced."""
+    cls._instance = None
+    lock = cls._instance_lock
+    if not isinstance(lock, _LOCK_TYPE) or lock.locked():
+        cls._instance_lock = Lock()
+
+def _duplicate_test_names(path):
+    """Return ``Class.test_name`` entries defined more than once in a test module."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    duplicates = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        seen = set()
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test"):
+                if item.name in seen:
+                    duplicates.append(f"{node.name}.{item.name}")
+                seen.add(item.name)
+    return duplicates
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Skip tests marked 'singleton' that rebuild the tracker singleton",
+    )
 
-@pytest.fixture(autouse=True)
-def isolated_env(monkeypatch):
+def pytest_collection_modifyitems(config, items):
     """
-    A fixture that automatically runs for every test to ensure an
-    isolated environment by removing specific environment variables.
-    This ensures tests don't pick up values from .env files.
-    """
-    # Remove any environment variables that could interfere with tests
-    # monkeypatch.delenv makes os.getenv() return None for these keys
-    monkeypatch.delenv("AGENTSIGHT_TOKEN_HANDLER_TYPE", raising=False)
-    monkeypatch.delenv("AGENTSIGHT_API_KEY", raising=False)
-    monkeypatch.delenv("AGENTSIGHT_CONVERSATION_ID", raising=False)
+    Fail collection when a test class defines the same test name twice.
+    The later definition silently shadows the earlier one, so the first
+    body would never run.
 
-@pytest.fixture
+    With ``--fast``, deselect tests marked ``singleton``.
+    """
+    errors = []
+    for path in sorted({item.path for item in items}):
+        errors.extend(f"{path}: {name}" for name in _duplicate_test_names(path))
+    if errors:
+        raise pytest.UsageError("Duplicate test definitions found:\n  " + "\n  ".join(errors))
+
+    if config.getoption("--fast"):
+        deselected = [item for item in items if item.get_closest_marker("singleton")]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if not item.get_closest_marker("singleton")]
+
+@pytest.fixture(scope="session")
 def valid_api_key():
     """Valid API key for testing."""
     return "ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3"
@@ -35,101 +80,9 @@ def test_config(valid_api_key):
     return config
 
 @pytest.fixture
-def mock_successful_response():
-    """Mock successful HTTP response."""
-    response = MagicMock()
-    response.status_code = 200
-    response.json.return_value = {"status": "success", "message": "Saved successfully"}
-    response.content = b'{"status": "success", "message": "Saved successfully"}'
-    return response
-
-@pytest.fixture
-def mock_error_response():
-    """Mock error HTTP response."""
-    response = MagicMock()
-    response.status_code = 400
-    response.json.return_value = {"error": "Bad Request", "message": "Invalid data"}
-    return response
-
-@pytest.fixture
-def valid_conversation_data():
-    """Fixture providing valid conversation data."""
-    return {
-        "conversation": "conv_123",
-        "content": "Hello world"
-    }
-
-@pytest.fixture
-def valid_action_data():
-    """Fixture providing valid action data."""
-    return {
-        "conversation": "conv_123",
-        "action_name": "calculate"
-    }
-
-@pytest.fixture
-def valid_button_data():
-    """Fixture providing valid button data."""
-    return {
-        "conversation": "conv_123",
-        "button_event": "click",
-        "label": "Submit",
-        "value": "submit_form"
-    }
-
-@pytest.fixture
-def sample_attachment():
-    """Fixture providing a sample attachment."""
-    return {
-        'filename': 'sample.txt',
-        'mime_type': 'text/plain',
-        'data': BytesIO(b"sample content")
-    }
-
-@pytest.fixture
-def multiple_attachments():
-    """Fixture providing multiple attachments."""
-    return [
-        {
-            'filename': 'file1.txt',
-            'mime_type': 'text/plain',
-            'data': BytesIO(b"content 1")
-        },
-        {
-            'filename': 'file2.pdf',
-            'mime_type': 'application/pdf',
-            'data': BytesIO(b"content 2")
-        }
-    ]
-
-@pytest.fixture
-def tracker():
+def tracker(valid_api_key):
     """Fixture providing a ConversationTracker instance."""
-    return ConversationTracker(api_key="ags_1a2b3c4d5e6f7890abcdef1234567890_a1b2c3")
-
-@pytest.fixture
-def mock_http_client():
-    """Fixture providing a mock HTTP client."""
-    mock_client = Mock()
-    mock_client.send_payload.return_value = {"success": True}
-    mock_client.send_form_data_payload.return_value = {"success": True}
-    return mock_client
-
-@pytest.fixture
-def sample_attachments():
-    """Fixture providing sample attachment data."""
-    return [
-        {
-            "filename": "test1.txt",
-            "mime_type": "text/plain",
-            "data": BytesIO(b"test content 1")
-        },
-        {
-            "filename": "test2.pdf",
-            "mime_type": "application/pdf",
-            "data": BytesIO(b"test content 2")
-        }
-    ]
+    return ConversationTracker(api_key=valid_api_key)
 
 @pytest.fixture
 def reset_singleton():
@@ -149,23 +102,22 @@ def reset_singleton():
     ConversationTracker._instance_lock = original_lock
 
 @pytest.fixture(autouse=True)
-def reset_all_singletons(request):
-    """Fixture to reset all client singletons before each test to prevent state leakage."""
+def reset_all_singletons(request, monkeypatch):
+    """
+    Runs for every test: removes AgentSight environment variables so tests
+    don't pick up values from .env files, then resets all client singletons
+    to prevent state leakage (skipped for tests marked ``no_reset``).
+    """
+    # monkeypatch.delenv makes os.getenv() return None for these keys
+    for name in _ENV_VARS_TO_CLEAR:
+        monkeypatch.delenv(name, raising=False)
 
-    if 'no_reset' in request.keywords:
+    if request.node.get_closest_marker('no_reset'):
         yield
         return
 
-    from agentsight.client.api_client import AgentSightAPI
-    from agentsight.client.conversation_manager_client import ConversationManager
-    from agentsight.client.main_client import ConversationTracker
-    
     # Reset all singletons BEFORE the test
-    ConversationTracker._instance = None
-    ConversationTracker._instance_lock = Lock()
-    AgentSightAPI._instance = None
-    AgentSightAPI._instance_lock = Lock()
-    ConversationManager._instance = None
-    ConversationManager._instance_lock = Lock()
+    for cls in (ConversationTracker, AgentSightAPI, ConversationManager):
+        _reset_singleton_class(cls)
     
     yield
@@ -1,130 +1,77 @@
 import pytest
-from unittest.mock import MagicMock
 from io import BytesIO
-import time
+from datetime import datetime, timezone
 from agentsight.helpers import prepare_form_data_payload_from_data
 from agentsight.enums import Sender
 
+_CONTENT = b"content"
+_BULK_PAYLOADS = [f"content_{i}".encode() for i in range(100)]
+_BULK_FILENAMES = [f'file_{i}.txt' for i in range(100)]
+_BULK_KEYS = {f'attachment_{i}' for i in range(100)}
+
+
+def _parse_iso(timestamp):
+    """Parse an ISO 8601 timestamp, accepting a trailing ``Z`` for UTC."""
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    return datetime.fromisoformat(timestamp)
+
+
+class _SeekRecorder:
+    """File stub that records the offsets passed to ``seek``."""
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def seek(self, offset):
+        self.calls.append(offset)
+
 
 class TestPrepareFormDataPayloadFromData:
     """Test cases for prepare_form_data_payload_from_data function."""
     
-    def test_single_attachment(self):
-        """Test preparing form data with single attachment."""
-        file_data = BytesIO(b"test file content")
+    @pytest.mark.parametrize("files, conversation_id", [
+        pytest.param([('test.txt', 'text/plain')], "conv_123", id="single_attachment"),
+        pytest.param([
+            ('file1.txt', 'text/plain'),
+            ('file2.pdf', 'application/pdf'),
+            ('file3.jpg', 'image/jpeg'),
+        ], "conv_456", id="multiple_attachments"),
+        pytest.param([], "conv_789", id="empty_attachments_list"),
+    ])
+    def test_form_data_layout(self, files, conversation_id):
+        """Test metadata fields and one ``attachment_<i>`` entry per attachment, in order."""
+        streams = [BytesIO(_CONTENT) for _ in files]
         attachments = [
-            {
-                'filename': 'test.txt',
-                'mime_type': 'text/plain',
-                'data': file_data
-            }
+            {'filename': filename, 'mime_type': mime_type, 'data': stream}
+            for (filename, mime_type), stream in zip(files, streams)
         ]
-        conversation_id = "conv_123"
         sender = Sender.USER.value
         
         result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
         
         # Check metadata fields
-        assert result['conversation'] == (None, "conv_123")
+        assert result['conversation'] == (None, conversation_id)
         assert result['mode'] == (None, 'form_data')
         assert result['sender'] == (None, sender)
-        assert 'timestamp' in result
         assert result['timestamp'][0] is None
         assert isinstance(result['timestamp'][1], str)
         assert 'T' in result['timestamp'][1]  # ISO format
         
-        # Check attachment
-        assert 'attachment_0' in result
-        filename, file_obj, mime_type = result['attachment_0']
-        assert filename == 'test.txt'
-        assert mime_type == 'text/plain'
-        assert file_obj == file_data
-    
-    def test_multiple_attachments(self):
-        """Test preparing form data with multiple attachments."""
-        file_data_1 = BytesIO(b"first file content")
-        file_data_2 = BytesIO(b"second file content")
-        file_data_3 = BytesIO(b"third file content")
-        
-        attachments = [
-            {
-                'filename': 'file1.txt',
-                'mime_type': 'text/plain',
-                'data': file_data_1
-            },
-            {
-                'filename': 'file2.pdf',
-                'mime_type': 'application/pdf',
-                'data': file_data_2
-            },
-            {
-                'filename': 'file3.jpg',
-                'mime_type': 'image/jpeg',
-                'data': file_data_3
-            }
-        ]
-        conversation_id = "conv_456"
-        sender = Sender.USER.value
-        
-        result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
-        
-        # Check metadata fields
-        assert result['conversation'] == (None, "conv_456")
-        assert result['mode'] == (None, 'form_data')
-        assert result['sender'] == (None, sender)
-        assert 'timestamp' in result
-        assert result['timestamp'][0] is None
-        assert isinstance(result['timestamp'][1], str)
-        
-        # Check first attachment
-        assert 'attachment_0' in result
-        filename, file_obj, mime_type = result['attachment_0']
-        assert filename == 'file1.txt'
-        assert mime_type == 'text/plain'
-        assert file_obj == file_data_1
-        
-        # Check second attachment
-        assert 'attachment_1' in result
-        filename, file_obj, mime_type = result['attachment_1']
-        assert filename == 'file2.pdf'
-        assert mime_type == 'application/pdf'
-        assert file_obj == file_data_2
-        
-        # Check third attachment
-        assert 'attachment_2' in result
-        filename, file_obj, mime_type = result['attachment_2']
-        assert filename == 'file3.jpg'
-        assert mime_type == 'image/jpeg'
-        assert file_obj == file_data_3
-        
-        # Verify 8 keys (5 metadata + 3 attachments)
-        assert len(result) == 8
-    
-    def test_empty_attachments_list(self):
-        """Test preparing form data with empty attachments list."""
-        attachments = []
-        conversation_id = "conv_789"
-        sender = Sender.USER.value
-        
-        result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
-        
-        # Check metadata fields only
-        assert result['conversation'] == (None, "conv_789")
-        assert result['mode'] == (None, 'form_data')
-        assert result['sender'] == (None, sender)
-        assert 'timestamp' in result
-        assert result['timestamp'][0] is None
-        assert isinstance(result['timestamp'][1], str)
+        # Check attachments, passed through as (filename, file object, mime type)
+        for i, ((filename, mime_type), stream) in enumerate(zip(files, streams)):
+            assert result[f'attachment_{i}'] == (filename, stream, mime_type)
         
-        # Should only have metadata, no attachments
-        assert len(result) == 5
-        assert 'attachment_0' not in result
+        # 5 metadata keys plus one per attachment
+        assert len(result) == 5 + len(files)
+        assert f'attachment_{len(files)}' not in result
     
     def test_file_seek_called(self):
         """Test that file.seek(0) is called on each attachment."""
-        # Create mock file objects
-        mock_file_1 = MagicMock()
-        mock_file_2 = MagicMock()
+        # Create file stubs that record seek calls
+        mock_file_1 = _SeekRecorder()
+        mock_file_2 = _SeekRecorder()
         
         attachments = [
             {
@@ -144,122 +91,56 @@ class TestPrepareFormDataPayloadFromData:
         result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
         
         # Verify seek(0) was called on each file
-        mock_file_1.seek.assert_called_once_with(0)
-        mock_file_2.seek.assert_called_once_with(0)
+        assert mock_file_1.calls == [0]
+        assert mock_file_2.calls == [0]
         
         # Verify files are in result
         assert result['attachment_0'][1] == mock_file_1
         assert result['attachment_1'][1] == mock_file_2
     
-    def test_various_mime_types(self):
-        """Test with various MIME types."""
+    @pytest.mark.parametrize("files", [
+        pytest.param([
+            ('document.pdf', 'application/pdf'),
+            ('image.png', 'image/png'),
+            ('video.mp4', 'video/mp4'),
+            ('audio.mp3', 'audio/mpeg'),
+        ], id="mime_types"),
+        pytest.param([
+            ('file with spaces.txt', 'text/plain'),
+            ('file-with-dashes.pdf', 'application/pdf'),
+            ('file_with_underscores.jpg', 'image/jpeg'),
+            ('file.with.dots.png', 'image/png'),
+        ], id="special_characters"),
+        pytest.param([
+            ('文档.pdf', 'application/pdf'),  # Chinese
+            ('файл.txt', 'text/plain'),  # Russian
+            ('émojis_😀.png', 'image/png'),  # French + emoji
+        ], id="unicode"),
+    ])
+    def test_filenames_and_mime_types_preserved(self, files):
+        """Test that each attachment keeps its filename and MIME type, in order."""
         attachments = [
-            {
-                'filename': 'document.pdf',
-                'mime_type': 'application/pdf',
-                'data': BytesIO(b"pdf content")
-            },
-            {
-                'filename': 'image.png',
-                'mime_type': 'image/png',
-                'data': BytesIO(b"png content")
-            },
-            {
-                'filename': 'video.mp4',
-                'mime_type': 'video/mp4',
-                'data': BytesIO(b"mp4 content")
-            },
-            {
-                'filename': 'audio.mp3',
-                'mime_type': 'audio/mpeg',
-                'data': BytesIO(b"mp3 content")
-            }
-        ]
-        conversation_id = "conv_mime_test"
-        sender = Sender.USER.value
-        
-        result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
-        
-        # Check each attachment has correct MIME type
-        assert result['attachment_0'][2] == 'application/pdf'
-        assert result['attachment_1'][2] == 'image/png'
-        assert result['attachment_2'][2] == 'video/mp4'
-        assert result['attachment_3'][2] == 'audio/mpeg'
-    
-    def test_special_characters_in_filename(self):
-        """Test with special characters in filenames."""
-        attachments = [
-            {
-                'filename': 'file with spaces.txt',
-                'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
-            },
-            {
-                'filename': 'file-with-dashes.pdf',
-                'mime_type': 'application/pdf',
-                'data': BytesIO(b"content")
-            },
-            {
-                'filename': 'file_with_underscores.jpg',
-                'mime_type': 'image/jpeg',
-                'data': BytesIO(b"content")
-            },
-            {
-                'filename': 'file.with.dots.png',
-                'mime_type': 'image/png',
-                'data': BytesIO(b"content")
-            }
+            {'filename': filename, 'mime_type': mime_type, 'data': BytesIO(_CONTENT)}
+            for filename, mime_type in files
         ]
-        conversation_id = "conv_special_chars"
-        sender = Sender.USER.value
         
-        result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
+        result = prepare_form_data_payload_from_data(attachments, "conv_123", Sender.USER.value)
         
-        # Check filenames are preserved
-        assert result['attachment_0'][0] == 'file with spaces.txt'
-        assert result['attachment_1'][0] == 'file-with-dashes.pdf'
-        assert result['attachment_2'][0] == 'file_with_underscores.jpg'
-        assert result['attachment_3'][0] == 'file.with.dots.png'
+        for i, (filename, mime_type) in enumerate(files):
+            assert result[f'attachment_{i}'][0] == filename
+            assert result[f'attachment_{i}'][2] == mime_type
     
-    def test_unicode_filenames(self):
-        """Test with unicode characters in filenames."""
+    def test_large_number_of_attachments(self):
+        """Test with a large number of attachments."""
+        # Create 100 attachments
         attachments = [
             {
-                'filename': '文档.pdf',  # Chinese
-                'mime_type': 'application/pdf',
-                'data': BytesIO(b"content")
-            },
-            {
-                'filename': 'файл.txt',  # Russian
+                'filename': filename,
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
-            },
-            {
-                'filename': 'émojis_😀.png',  # French + emoji
-                'mime_type': 'image/png',
-                'data': BytesIO(b"content")
+                'data': BytesIO(payload)
             }
+            for filename, payload in zip(_BULK_FILENAMES, _BULK_PAYLOADS)
         ]
-        conversation_id = "conv_unicode"
-        sender = Sender.USER.value
-        
-        result = prepare_form_data_payload_from_data(attachments, conversation_id, sender)
-        
-        # Check unicode filenames are preserved
-        assert result['attachment_0'][0] == '文档.pdf'
-        assert result['attachment_1'][0] == 'файл.txt'
-        assert result['attachment_2'][0] == 'émojis_😀.png'
-    
-    def test_large_number_of_attachments(self):
-        """Test with a large number of attachments."""
-        # Create 100 attachments
-        attachments = []
-        for i in range(100):
-            attachments.append({
-                'filename': f'file_{i}.txt',
-                'mime_type': 'text/plain',
-                'data': BytesIO(f"content_{i}".encode())
-            })
         
         conversation_id = "conv_large_batch"
         sender = Sender.USER.value
@@ -281,8 +162,7 @@ class TestPrepareFormDataPayloadFromData:
         assert result['attachment_99'][0] == 'file_99.txt'
         
         # Check all attachment keys exist
-        for i in range(100):
-            assert f'attachment_{i}' in result
+        assert _BULK_KEYS <= result.keys()
     
     def test_conversation_id_types(self):
         """Test with different conversation ID types."""
@@ -290,7 +170,7 @@ class TestPrepareFormDataPayloadFromData:
             {
                 'filename': 'test.txt',
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
+                'data': BytesIO(_CONTENT)
             }
         ]
         sender = Sender.USER.value
@@ -309,7 +189,7 @@ class TestPrepareFormDataPayloadFromData:
             {
                 'filename': 'test.txt',
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
+                'data': BytesIO(_CONTENT)
             }
         ]
         conversation_id = "conv_sender_test"
@@ -333,54 +213,39 @@ class TestPrepareFormDataPayloadFromData:
             {
                 'filename': 'test.txt',
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
+                'data': BytesIO(_CONTENT)
             }
         ]
         sender = Sender.USER.value
         
-        # Call the function multiple times
-        result1 = prepare_form_data_payload_from_data(attachments, "conv_123", sender)
-        time.sleep(0.01)  # Small delay to ensure different timestamp
-        result2 = prepare_form_data_payload_from_data(attachments, "conv_123", sender)
+        result = prepare_form_data_payload_from_data(attachments, "conv_123", sender)
         
         # Verify timestamp is present and realistic
-        assert 'timestamp' in result1
-        assert 'timestamp' in result2
-        assert result1['timestamp'][0] is None
-        assert result2['timestamp'][0] is None
-        
-        # Verify timestamps are different (proving function is being called)
-        assert result1['timestamp'][1] != result2['timestamp'][1]
+        assert 'timestamp' in result
+        assert result['timestamp'][0] is None
         
         # Verify timestamp format (should be ISO format)
-        timestamp_value = result1['timestamp'][1]
+        timestamp_value = result['timestamp'][1]
         assert isinstance(timestamp_value, str)
         assert 'T' in timestamp_value  # ISO format has T separator
         
-        # Verify timestamps are recent (within last few seconds)
-        import datetime
-        try:
-            # Try to parse the timestamp to verify it's valid ISO format
-            if timestamp_value.endswith('Z'):
-                parsed_time = datetime.datetime.fromisoformat(timestamp_value.replace('Z', '+00:00'))
-            else:
-                parsed_time = datetime.datetime.fromisoformat(timestamp_value)
-            
-            # Should be within last 10 seconds
-            now = datetime.datetime.now(datetime.timezone.utc)
-            time_diff = abs((now - parsed_time).total_seconds())
-            assert time_diff < 10, f"Timestamp {timestamp_value} is not recent enough"
-        except ValueError:
-            # If parsing fails, at least check basic format
-            assert len(timestamp_value) > 10  # Should be a reasonable timestamp length
+        # Verify timestamps are recent (within last 10 seconds)
+        time_diff = abs((datetime.now(timezone.utc) - _parse_iso(timestamp_value)).total_seconds())
+        assert time_diff < 10, f"Timestamp {timestamp_value} is not recent enough"
     
-    def test_multiple_calls_different_timestamps(self):
+    def test_multiple_calls_different_timestamps(self, monkeypatch):
         """Test that multiple calls generate different timestamps."""
+        # Fake clock: each call returns the next microsecond
+        clock = iter(range(10**6))
+        monkeypatch.setattr(
+            'agentsight.helpers.attachments.get_iso_timestamp',
+            lambda: f'2024-01-01T00:00:00.{next(clock):06d}+00:00'
+        )
         attachments = [
             {
                 'filename': 'test.txt',
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
+                'data': BytesIO(_CONTENT)
             }
         ]
         sender = Sender.USER.value
@@ -389,9 +254,9 @@ class TestPrepareFormDataPayloadFromData:
         for i in range(5):
             result = prepare_form_data_payload_from_data(attachments, f"conv_{i}", sender)
             timestamps.append(result['timestamp'][1])
-            time.sleep(0.001)  # Small delay
         
-        # All timestamps should be different
+        # Each call should read the clock once, so all timestamps are different
+        assert timestamps == [f'2024-01-01T00:00:00.{i:06d}+00:00' for i in range(5)]
         assert len(set(timestamps)) == 5, "All timestamps should be unique"
         
         # All should be valid strings
@@ -405,7 +270,7 @@ class TestPrepareFormDataPayloadFromData:
             {
                 'filename': 'test.txt',
                 'mime_type': 'text/plain',
-                'data': BytesIO(b"content")
+                'data': BytesIO(_CONTENT)
             }
         ]
         sender = Sender.USER.value
@@ -426,3 +291,5 @@ class TestPrepareFormDataPayloadFromData:
             assert 'T' in ts
             # Should be reasonable length (ISO format is usually 20+ chars)
             assert len(ts) >= 20
+            # Should parse as an ISO timestamp
+            _parse_iso(ts)
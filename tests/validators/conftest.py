@@ -0,0 +1,68 @@
+from types import MappingProxyType
+
+import pytest
+
+# Valid baselines for the validator tests; templates are read-only and
+# each test gets a fresh copy to mutate
+
+
+@pytest.fixture(scope="module")
+def _qa_template():
+    """Valid question/answer payload built once per test module."""
+    return MappingProxyType({
+        "question": "What is 2+2?",
+        "answer": "4"
+    })
+
+
+@pytest.fixture
+def qa_data(_qa_template):
+    """Valid question/answer payload (a copy, so tests may mutate it)."""
+    return dict(_qa_template)
+
+
+@pytest.fixture(scope="module")
+def _action_template():
+    """Valid action payload built once per test module."""
+    return MappingProxyType({
+        "conversation_id": "conv_123",
+        "action_name": "calculate"
+    })
+
+
+@pytest.fixture
+def action_data(_action_template):
+    """Valid action payload (a copy, so tests may mutate it)."""
+    return dict(_action_template)
+
+
+@pytest.fixture(scope="module")
+def _button_template():
+    """Valid button payload built once per test module."""
+    return MappingProxyType({
+        "conversation_id": "conv_123",
+        "button_event": "click",
+        "label": "Submit",
+        "value": "submit_form"
+    })
+
+
+@pytest.fixture
+def button_data(_button_template):
+    """Valid button payload (a copy, so tests may mutate it)."""
+    return dict(_button_template)
+
+
+@pytest.fixture(scope="module")
+def _feedback_template():
+    """Valid feedback payload built once per test module."""
+    return MappingProxyType({
+        "conversation_id": "conv_123",
+        "sentiment": "positive"
+    })
+
+
+@pytest.fixture
+def feedback_data(_feedback_template):
+    """Valid feedback payload (a copy, so tests may mutate it)."""
+    return dict(_feedback_template)
@@ -27,6 +27,22 @@ class TestValidateAndProcessAttachmentsFlexible:
         
         assert "Attachments must be provided as a list" in str(exc_info.value)
 
+    @pytest.mark.parametrize("wrap", [tuple, iter], ids=["tuple", "generator"])
+    def test_non_list_iterable_attachments(self, wrap):
+        """Test validation accepts tuples and one-shot iterators of attachments."""
+        attachments = [{"data": b"content 1"}, {"data": b"content 2"}]
+        
+        result = validate_and_process_attachments_flexible(
+            wrap(attachments), AttachmentMode.FORM_DATA
+        )
+        
+        assert [item['data'] for item in result] == [b"content 1", b"content 2"]
+
+    def test_empty_iterator_attachments_raises_exception(self):
+        """Test validation raises exception when an attachments iterator yields nothing."""
+        with pytest.raises(InvalidAttachmentException, match="Attachments list cannot be empty"):
+            validate_and_process_attachments_flexible(iter([]), AttachmentMode.FORM_DATA)
+
     def test_base64_mode_valid_attachments(self):
         """Test validation passes with valid base64 attachments."""
         test_data = b"test file content"
@@ -77,6 +93,28 @@ class TestValidateAndProcessAttachmentsFlexible:
         
         assert "invalid base64 data" in str(exc_info.value)
 
+    @pytest.mark.parametrize("data, valid", [
+        ("YWJj", True),
+        ("YWI=", True),
+        ("YQ==", True),
+        ("YQ=", False),
+        ("YWJjZA", False),
+        ("Y===", False),
+        ("YW=J", False),
+        ("YWJj\n", False),
+        ("YWJjé", False),
+    ])
+    def test_base64_mode_padding_and_alphabet(self, data, valid):
+        """Test base64 validation matches the strict stdlib decoder."""
+        attachments = [{"filename": "test.txt", "mime_type": "text/plain", "data": data}]
+
+        if valid:
+            result = validate_and_process_attachments_flexible(attachments, AttachmentMode.BASE64)
+            assert result[0]["data"] == data
+        else:
+            with pytest.raises(InvalidAttachmentException, match="invalid base64 data"):
+                validate_and_process_attachments_flexible(attachments, AttachmentMode.BASE64)
+
     def test_form_data_mode_bytes_data(self):
         """Test validation passes with bytes data in form_data mode."""
         test_data = b"test file content"
@@ -118,6 +156,23 @@ class TestValidateAndProcessAttachmentsFlexible:
         assert result[0]['data'] == bytes_io_data  # Data is passed through as-is
         assert isinstance(result[0]['data'], BytesIO)
 
+    @pytest.mark.parametrize("make_data", [bytearray, memoryview], ids=["bytearray", "memoryview"])
+    def test_form_data_mode_buffer_data(self, make_data):
+        """Test form_data mode stores bytearray and memoryview payloads as bytes."""
+        test_data = make_data(b"test file content")
+        
+        result = validate_and_process_attachments_flexible(
+            [{"data": test_data}], AttachmentMode.FORM_DATA
+        )
+        
+        assert type(result[0]['data']) is bytes
+        assert result[0]['data'] == b"test file content"
+
+    def test_form_data_mode_non_binary_data_raises_exception(self):
+        """Test validation raises exception when form_data mode data is not bytes or file-like."""
+        with pytest.raises(InvalidAttachmentException, match="must be bytes or file-like object"):
+            validate_and_process_attachments_flexible([{"data": 123}], AttachmentMode.FORM_DATA)
+
     def test_form_data_mode_string_data_raises_exception(self):
         """Test validation raises exception when form_data mode data is string."""
         attachments = [
@@ -198,6 +253,7 @@ class TestValidateAndProcessAttachmentsFlexible:
         assert result[0]['mime_type'] == "text/plain"
         assert result[0]['extra_field'] == "extra_value"
         assert result[0]['another_field'] == 123
+        assert result[0]['data'] is test_data  # Payload is shared, not copied
 
     def test_form_data_mode_content_type_alias(self):
         """Test form_data mode handles content_type as alias for mime_type."""
@@ -218,3 +274,4 @@ class TestValidateAndProcessAttachmentsFlexible:
         assert result[0]['filename'] == "test.txt"
         assert result[0]['mime_type'] == "text/plain"
         assert 'content_type' not in result[0]  # content_type is not preserved, only mime_type
+        assert attachments[0]['content_type'] == "text/plain"  # Input attachment is left untouched